@@ -1,13 +1,39 @@
 # ruff: noqa
-import warnings
-
-warnings.filterwarnings("ignore", category=UserWarning)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from asknews_sdk.version import __version__
-from asknews_sdk.sdk import AskNewsSDK, AsyncAskNewsSDK
+from asknews_sdk.runtime import install_fast_event_loop
+
+if TYPE_CHECKING:
+    from asknews_sdk.sdk import AskNewsSDK, AsyncAskNewsSDK
+
+# The SDK classes pull in httpx, cryptography and every pydantic model, so
+# they are only imported on first access.
+_LAZY_ATTRIBUTES = {
+    "AskNewsSDK": "asknews_sdk.sdk",
+    "AsyncAskNewsSDK": "asknews_sdk.sdk",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = (
     "__version__",
     "AskNewsSDK",
     "AsyncAskNewsSDK",
+    "install_fast_event_loop",
 )
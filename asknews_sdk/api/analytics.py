@@ -1,10 +1,76 @@
 from datetime import datetime
-from typing import Dict, Literal, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Union, get_args
 
 from asknews_sdk.api.base import BaseAPI
 from asknews_sdk.dto.sentiment import FinanceResponse
 
 
+Asset = Literal[
+    "bitcoin",
+    "ethereum",
+    "cardano",
+    "uniswap",
+    "ripple",
+    "solana",
+    "polkadot",
+    "polygon",
+    "chainlink",
+    "tether",
+    "dogecoin",
+    "monero",
+    "tron",
+    "binance",
+    "aave",
+    "tesla",
+    "microsoft",
+    "amazon",
+]
+SentimentMetric = Literal[
+    "news_positive",
+    "news_negative",
+    "news_total",
+    "news_positive_weighted",
+    "news_negative_weighted",
+    "news_total_weighted",
+]
+
+_ASSETS = frozenset(get_args(Asset))
+_METRICS = frozenset(get_args(SentimentMetric))
+_ACCEPT = ((FinanceResponse.__content_type__, 1.0),)
+
+
+def _build_sentiment_request(
+    asset: str,
+    metric: str,
+    date_from: Optional[Union[datetime, str]],
+    date_to: Optional[Union[datetime, str]],
+    http_headers: Optional[Dict],
+) -> Dict[str, Any]:
+    if asset not in _ASSETS:
+        raise ValueError(f"Invalid asset: {asset}")
+    if metric not in _METRICS:
+        raise ValueError(f"Invalid metric: {metric}")
+
+    if isinstance(date_from, datetime):
+        date_from = date_from.isoformat()
+    if isinstance(date_to, datetime):
+        date_to = date_to.isoformat()
+
+    return {
+        "method": "GET",
+        "endpoint": "/v1/analytics/finance/sentiment",
+        "query": {
+            "asset": asset,
+            "metric": metric,
+            "date_from": date_from,
+            "date_to": date_to,
+        },
+        "headers": http_headers,
+        "accept": _ACCEPT,
+    }
+
+
 class AnalyticsAPI(BaseAPI):
     """
     Analytics API
@@ -12,36 +78,12 @@ class AnalyticsAPI(BaseAPI):
     https://docs.asknews.app/en/reference#tag--analytics
     """
 
+    __slots__ = ()
+
     def get_asset_sentiment(
         self,
-        asset: Literal[
-            "bitcoin",
-            "ethereum",
-            "cardano",
-            "uniswap",
-            "ripple",
-            "solana",
-            "polkadot",
-            "polygon",
-            "chainlink",
-            "tether",
-            "dogecoin",
-            "monero",
-            "tron",
-            "binance",
-            "aave",
-            "tesla",
-            "microsoft",
-            "amazon",
-        ],
-        metric: Literal[
-            "news_positive",
-            "news_negative",
-            "news_total",
-            "news_positive_weighted",
-            "news_negative_weighted",
-            "news_total_weighted",
-        ] = "news_positive",
+        asset: Asset,
+        metric: SentimentMetric = "news_positive",
         date_from: Optional[Union[datetime, str]] = None,
         date_to: Optional[Union[datetime, str]] = None,
         *,
@@ -52,8 +94,8 @@ class AnalyticsAPI(BaseAPI):
 
         https://docs.asknews.app/en/reference#get-/v1/analytics/finance/sentiment
 
-        :param slug: The asset slug.
-        :type slug: str
+        :param asset: The asset slug.
+        :type asset: str
         :param metric: The sentiment metric.
         :type metric: str
         :param date_from: The start date in ISO format.
@@ -65,24 +107,13 @@ class AnalyticsAPI(BaseAPI):
         :return: The sentiment response.
         :rtype: FinanceResponse
         """
-        if isinstance(date_from, datetime):
-            date_from = date_from.isoformat()
-        if isinstance(date_to, datetime):
-            date_to = date_to.isoformat()
-
-        response = self.client.request(
-            method="GET",
-            endpoint="/v1/analytics/finance/sentiment",
-            query={
-                "asset": asset,
-                "metric": metric,
-                "date_from": date_from,
-                "date_to": date_to,
-            },
-            headers=http_headers,
-            accept=[(FinanceResponse.__content_type__, 1.0)],
-        )
-        return FinanceResponse.model_validate(response.content)
+        request = _build_sentiment_request(asset, metric, date_from, date_to, http_headers)
+
+        def _load() -> FinanceResponse:
+            response = self.client.request(**request)
+            return self._parse(FinanceResponse, response)
+
+        return self._cached_request(("sentiment", *request["query"].values()), _load, http_headers)
 
 
 class AsyncAnalyticsAPI(BaseAPI):
@@ -92,36 +123,12 @@ class AsyncAnalyticsAPI(BaseAPI):
     https://docs.asknews.app/en/reference#tag--analytics
     """
 
+    __slots__ = ()
+
     async def get_asset_sentiment(
         self,
-        asset: Literal[
-            "bitcoin",
-            "ethereum",
-            "cardano",
-            "uniswap",
-            "ripple",
-            "solana",
-            "polkadot",
-            "polygon",
-            "chainlink",
-            "tether",
-            "dogecoin",
-            "monero",
-            "tron",
-            "binance",
-            "aave",
-            "tesla",
-            "microsoft",
-            "amazon",
-        ],
-        metric: Literal[
-            "news_positive",
-            "news_negative",
-            "news_total",
-            "news_positive_weighted",
-            "news_negative_weighted",
-            "news_total_weighted",
-        ] = "news_positive",
+        asset: Asset,
+        metric: SentimentMetric = "news_positive",
         date_from: Optional[Union[datetime, str]] = None,
         date_to: Optional[Union[datetime, str]] = None,
         *,
@@ -132,8 +139,8 @@ class AsyncAnalyticsAPI(BaseAPI):
 
         https://docs.asknews.app/en/reference#get-/v1/analytics/finance/sentiment
 
-        :param slug: The asset slug.
-        :type slug: str
+        :param asset: The asset slug.
+        :type asset: str
         :param metric: The sentiment metric.
         :type metric: str
         :param date_from: The start date in ISO format.
@@ -145,21 +152,66 @@ class AsyncAnalyticsAPI(BaseAPI):
         :return: The sentiment response.
         :rtype: FinanceResponse
         """
-        if isinstance(date_from, datetime):
-            date_from = date_from.isoformat()
-        if isinstance(date_to, datetime):
-            date_to = date_to.isoformat()
-
-        response = await self.client.request(
-            method="GET",
-            endpoint="/v1/analytics/finance/sentiment",
-            query={
-                "asset": asset,
-                "metric": metric,
-                "date_from": date_from,
-                "date_to": date_to,
-            },
-            headers=http_headers,
-            accept=[(FinanceResponse.__content_type__, 1.0)],
+        request = _build_sentiment_request(asset, metric, date_from, date_to, http_headers)
+
+        async def _load() -> FinanceResponse:
+            response = await self.client.request(**request)
+            return self._parse(FinanceResponse, response)
+
+        return await self._acached_request(
+            ("sentiment", *request["query"].values()), _load, http_headers
+        )
+
+    async def get_assets_sentiment(
+        self,
+        assets: List[Asset],
+        metric: SentimentMetric = "news_positive",
+        date_from: Optional[Union[datetime, str]] = None,
+        date_to: Optional[Union[datetime, str]] = None,
+        *,
+        max_concurrency: int = 8,
+        http_headers: Optional[Dict] = None,
+    ) -> Dict[str, FinanceResponse]:
+        """
+        Get the timeseries sentiment for several assets at once.
+
+        The API serves one asset per request, so the requests are sent
+        concurrently and share the client's connection pool. Every asset is
+        validated before any request is sent.
+
+        https://docs.asknews.app/en/reference#get-/v1/analytics/finance/sentiment
+
+        :param assets: The asset slugs.
+        :type assets: List[str]
+        :param metric: The sentiment metric.
+        :type metric: str
+        :param date_from: The start date in ISO format.
+        :type date_from: Optional[Union[str, datetime]]
+        :param date_to: The end date in ISO format.
+        :type date_to: Optional[Union[str, datetime]]
+        :param max_concurrency: The maximum number of requests in flight.
+        :type max_concurrency: int
+        :param http_headers: Additional HTTP headers.
+        :type http_headers: Optional[Dict]
+        :return: The sentiment responses keyed by asset.
+        :rtype: Dict[str, FinanceResponse]
+        """
+        assets = list(dict.fromkeys(assets))
+        for asset in assets:
+            _build_sentiment_request(asset, metric, date_from, date_to, http_headers)
+
+        responses = await self._gather(
+            (
+                partial(
+                    self.get_asset_sentiment,
+                    asset,
+                    metric,
+                    date_from,
+                    date_to,
+                    http_headers=http_headers,
+                )
+                for asset in assets
+            ),
+            max_concurrency,
         )
-        return FinanceResponse.model_validate(response.content)
+        return dict(zip(assets, responses))
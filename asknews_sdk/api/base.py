@@ -1,8 +1,258 @@
-from typing import Union
+import asyncio
+import os
+from functools import partial
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
+from httpx import HTTPError
+from pydantic import BaseModel
+
+from asknews_sdk.cache import MISSING, TTLCache
 from asknews_sdk.client import APIClient, AsyncAPIClient
+from asknews_sdk.errors import APIError
+from asknews_sdk.response import APIResponse
+from asknews_sdk.utils import construct_model, deserialize
+
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+class _KeyLock:
+    """
+    A per-key lock that counts the callers using it.
+    """
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class _Flight:
+    """
+    An in-flight request shared by concurrent callers.
+    """
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
 
 
 class BaseAPI:
-    def __init__(self, client: Union[APIClient, AsyncAPIClient]) -> None:
+    """
+    Base class for the API groups.
+
+    :param client: The API client.
+    :type client: Union[APIClient, AsyncAPIClient]
+    :param cache: An optional cache for responses of idempotent endpoints.
+        Requests made with extra HTTP headers bypass the cache, since the
+        headers may change the response.
+    :type cache: Optional[TTLCache]
+    :param cache_ttls: Per-endpoint TTLs in seconds, overriding the cache TTL.
+    :type cache_ttls: Optional[Dict[str, float]]
+    :param serve_stale: Whether to return an expired cached response when the
+        request fails.
+    :type serve_stale: bool
+    :param validate_responses: Whether to validate response bodies against their
+        models. When disabled, responses are trusted and constructed without
+        validation, which is faster but assumes they match the models. Defaults
+        to validating unless the `ASKNEWS_TRUST_SERVER` environment variable is
+        set to "1" when the API is created.
+    :type validate_responses: Optional[bool]
+    :param coalesce_requests: Whether concurrent identical async requests to
+        idempotent endpoints share a single request and response when no cache
+        is configured. Requests made with extra HTTP headers are never shared.
+    :type coalesce_requests: bool
+    """
+
+    __slots__ = (
+        "client",
+        "cache",
+        "cache_ttls",
+        "serve_stale",
+        "validate_responses",
+        "coalesce_requests",
+        "_cache_locks",
+        "_inflight",
+    )
+
+    def __init__(
+        self,
+        client: Union[APIClient, AsyncAPIClient],
+        cache: Optional[TTLCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        serve_stale: bool = False,
+        validate_responses: Optional[bool] = None,
+        coalesce_requests: bool = False,
+    ) -> None:
         self.client = client
+        self.cache = cache
+        self.cache_ttls = cache_ttls or {}
+        self.serve_stale = serve_stale
+        if validate_responses is None:
+            validate_responses = os.environ.get("ASKNEWS_TRUST_SERVER", "0") != "1"
+        self.validate_responses = validate_responses
+        self.coalesce_requests = coalesce_requests
+        self._cache_locks: Dict[Hashable, _KeyLock] = {}
+        self._inflight: Dict[Hashable, _Flight] = {}
+
+    def _parse(self, model: Type[M], response: APIResponse) -> M:
+        """
+        Parse a response body into `model`, validating it unless disabled.
+        """
+        if self.validate_responses:
+            return model.model_validate_json(response.body)
+        return construct_model(model, response.content)
+
+    def _parse_json(self, model: Type[M], data: bytes) -> M:
+        """
+        Parse raw JSON, such as a stream event, into `model`, validating it
+        unless disabled.
+        """
+        if self.validate_responses:
+            return model.model_validate_json(data)
+        return construct_model(model, deserialize(data))
+
+    def _load_stale(self, key: Tuple, exc: Exception):
+        if self.serve_stale and self.cache is not None:
+            value = self.cache.get_stale(key)
+            if value is not MISSING:
+                return value
+        raise exc
+
+    def _cached_request(
+        self, key: Tuple, loader: Callable[[], T], http_headers: Optional[Dict] = None
+    ) -> T:
+        """
+        Return the cached value for `key`, calling `loader` on a miss.
+
+        The first item of `key` names the endpoint and selects its TTL. The
+        cache is bypassed when `http_headers` are given.
+        """
+        if self.cache is None or http_headers:
+            return loader()
+
+        value = self.cache.get(key)
+        if value is not MISSING:
+            return value
+
+        try:
+            value = loader()
+        except (APIError, HTTPError) as e:
+            return self._load_stale(key, e)
+
+        self.cache.set(key, value, self.cache_ttls.get(key[0]))
+        return value
+
+    async def _acached_request(
+        self, key: Tuple, loader: Callable[[], Awaitable[T]], http_headers: Optional[Dict] = None
+    ) -> T:
+        """
+        Return the cached value for `key`, awaiting `loader` on a miss.
+
+        Concurrent misses for the same key share a single request, and without
+        a cache they do so only if `coalesce_requests` is enabled. Both are
+        bypassed when `http_headers` are given.
+        """
+        if http_headers:
+            return await loader()
+
+        if self.cache is None:
+            if self.coalesce_requests:
+                return await self._single_flight(key, loader)
+            return await loader()
+
+        value = self.cache.get(key)
+        if value is not MISSING:
+            return value
+
+        # The lock is kept until every caller waiting on it is done, so a late
+        # caller can't start a second request alongside a woken waiter
+        key_lock = self._cache_locks.get(key)
+        if key_lock is None:
+            key_lock = self._cache_locks[key] = _KeyLock()
+
+        key_lock.users += 1
+        try:
+            async with key_lock.lock:
+                value = self.cache.get(key)
+                if value is not MISSING:
+                    return value
+
+                try:
+                    value = await loader()
+                except (APIError, HTTPError) as e:
+                    return self._load_stale(key, e)
+
+                self.cache.set(key, value, self.cache_ttls.get(key[0]))
+                return value
+        finally:
+            key_lock.users -= 1
+            if not key_lock.users:
+                del self._cache_locks[key]
+
+    async def _single_flight(self, key: Tuple, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `loader`, sharing its result with concurrent calls for `key`.
+
+        The request is cancelled once every caller waiting on it is cancelled.
+        """
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = self._inflight[key] = _Flight(asyncio.ensure_future(loader()))
+            flight.task.add_done_callback(partial(self._end_flight, key, flight))
+
+        flight.waiters += 1
+        try:
+            # Shielded so one caller being cancelled doesn't cancel the others
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()
+                self._end_flight(key, flight)
+
+    def _end_flight(
+        self, key: Tuple, flight: _Flight, task: Optional[asyncio.Future] = None
+    ) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+        # Retrieve the exception so an error nobody awaited isn't logged as lost
+        if task is not None and not task.cancelled():
+            task.exception()
+
+    @staticmethod
+    async def _gather(
+        loaders: Iterable[Callable[[], Awaitable[T]]], max_concurrency: int
+    ) -> List[T]:
+        """
+        Await each of `loaders`, running at most `max_concurrency` at a time.
+
+        The results are returned in the order of `loaders`.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"Invalid max_concurrency: {max_concurrency}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(loader: Callable[[], Awaitable[T]]) -> T:
+            async with semaphore:
+                return await loader()
+
+        return list(await asyncio.gather(*(_bounded(loader) for loader in loaders)))
@@ -1,4 +1,6 @@
-from typing import AsyncIterator, Dict, Iterator, List, Literal, Optional, Union
+import os
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Union, get_args
 
 from asknews_sdk.api.base import BaseAPI
 from asknews_sdk.dto.chat import (
@@ -11,7 +13,190 @@ from asknews_sdk.dto.chat import (
     ListModelResponse,
     WebSearchResponse,
 )
-from asknews_sdk.response import EventSource
+from asknews_sdk.response import APIResponse, aiter_sse_data, iter_sse_data
+from asknews_sdk.utils import serialize
+
+
+ChatModel = Literal[
+    "gpt-4o-mini",
+    "gpt-4-1106-preview",
+    "open-mixtral-8x7b",
+    "meta-llama/Meta-Llama-3-70B-Instruct",
+    "meta-llama/Meta-Llama-3.1-70B-Instruct",
+    "meta-llama/Meta-Llama-3.3-70B-Instruct",
+    "meta-llama/Meta-Llama-3.1-405B-Instruct",
+    "claude-3-5-sonnet-20240620",
+    "claude-3-5-sonnet-latest",
+    "gpt-4o",
+]
+InlineCitations = Literal["markdown_link", "numbered", "none"]
+ForecastModel = Literal[
+    "gpt-4o",
+    "claude-3-5-sonnet-20240620",
+    "command-nightly",
+    "meta-llama/Meta-Llama-3.1-405B-Instruct",
+    "o1-mini",
+    "o1-preview",
+]
+ForecastMethod = Literal["nl", "kw", "both"]
+ForecastExpert = Literal["general", "sports"]
+
+_CHAT_MODELS = frozenset(get_args(ChatModel))
+_INLINE_CITATIONS = frozenset(get_args(InlineCitations))
+_FORECAST_MODELS = frozenset(get_args(ForecastModel))
+_FORECAST_METHODS = frozenset(get_args(ForecastMethod))
+_FORECAST_EXPERTS = frozenset(get_args(ForecastExpert))
+
+# Validate every chat request body against the request model before sending it,
+# useful for debugging but too slow to do by default.
+_VALIDATE_REQUESTS = os.environ.get("ASKNEWS_VALIDATE_REQUESTS", "0") == "1"
+
+# Defaults of the request fields the chat methods don't expose, so request
+# bodies can be built without going through the request model.
+_CHAT_COMPLETION_DEFAULTS = {
+    name: field.default
+    for name, field in CreateChatCompletionRequest.model_fields.items()
+    if not field.is_required() and name != "filter_params"
+}
+_CHAT_COMPLETION_HEADERS = {"Content-Type": CreateChatCompletionRequest.__content_type__}
+_CHAT_COMPLETION_ACCEPT = ((CreateChatCompletionResponse.__content_type__, 1.0),)
+_CHAT_COMPLETION_STREAM_ACCEPT = ((CreateChatCompletionResponseStream.__content_type__, 1.0),)
+_LIST_MODELS_ACCEPT = ((ListModelResponse.__content_type__, 1.0),)
+
+
+def _check_chat_args(messages: List[Dict[str, str]], model: str, inline_citations: str) -> None:
+    if model not in _CHAT_MODELS:
+        raise ValueError(f"Invalid model: {model}")
+    if inline_citations not in _INLINE_CITATIONS:
+        raise ValueError(f"Invalid inline_citations: {inline_citations}")
+
+    # A cheap shape check in place of validating every message with pydantic
+    for message in messages:
+        if not isinstance(message, dict) or "role" not in message or "content" not in message:
+            raise ValueError(f"Invalid message: {message}")
+
+
+def _check_headline_queries(queries: Optional[List[str]]) -> None:
+    if queries is None:
+        return
+    if not isinstance(queries, (list, tuple)) or not all(isinstance(q, str) for q in queries):
+        raise ValueError(f"Invalid queries: {queries}")
+
+
+def _compact(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in data.items() if value is not None}
+
+
+@lru_cache(maxsize=64)
+def _encode_chat_options(
+    model: str,
+    stream: bool,
+    inline_citations: str,
+    append_references: bool,
+    asknews_watermark: bool,
+    journalist_mode: bool,
+    conversational_awareness: bool,
+) -> bytes:
+    # The options rarely change between calls, so their JSON is encoded once
+    # and reused as the tail of the request body.
+    options = serialize(
+        _compact(
+            {
+                **_CHAT_COMPLETION_DEFAULTS,
+                "model": model,
+                "stream": stream,
+                "inline_citations": inline_citations,
+                "append_references": append_references,
+                "asknews_watermark": asknews_watermark,
+                "journalist_mode": journalist_mode,
+                "conversational_awareness": conversational_awareness,
+            }
+        )
+    )
+    return options[1:-1]
+
+
+def _encode_chat_body(
+    messages: List[Dict[str, str]], filter_params: Optional[Dict], *options
+) -> bytes:
+    parts = [b'{"messages":', serialize(messages)]
+
+    if filter_params is not None:
+        parts += (b',"filter_params":', serialize(filter_params))
+
+    parts += (b",", _encode_chat_options(*options), b"}")
+    body = b"".join(parts)
+
+    if _VALIDATE_REQUESTS:
+        CreateChatCompletionRequest.model_validate_json(body)
+
+    return body
+
+
+def _build_chat_request(
+    messages: List[Dict[str, str]],
+    model: str,
+    stream: bool,
+    inline_citations: str,
+    append_references: bool,
+    asknews_watermark: bool,
+    journalist_mode: bool,
+    conversational_awareness: bool,
+    filter_params: Optional[Dict],
+    http_headers: Optional[Dict],
+) -> Dict[str, Any]:
+    _check_chat_args(messages, model, inline_citations)
+
+    return {
+        "method": "POST",
+        "endpoint": "/v1/openai/chat/completions",
+        "body": _encode_chat_body(
+            messages,
+            filter_params,
+            model,
+            stream,
+            inline_citations,
+            append_references,
+            asknews_watermark,
+            journalist_mode,
+            conversational_awareness,
+        ),
+        "headers": (
+            _CHAT_COMPLETION_HEADERS
+            if http_headers is None
+            else {**http_headers, **_CHAT_COMPLETION_HEADERS}
+        ),
+        "accept": _CHAT_COMPLETION_STREAM_ACCEPT if stream else _CHAT_COMPLETION_ACCEPT,
+        "stream": stream,
+        "stream_type": "bytes",
+    }
+
+
+def _check_forecast_args(method: str, model: str, expert: str) -> None:
+    if method not in _FORECAST_METHODS:
+        raise ValueError(f"Invalid method: {method}")
+    if model not in _FORECAST_MODELS:
+        raise ValueError(f"Invalid model: {model}")
+    if expert not in _FORECAST_EXPERTS:
+        raise ValueError(f"Invalid expert: {expert}")
+
+
+def _iter_chat_stream(
+    api: BaseAPI, response: APIResponse
+) -> Iterator[CreateChatCompletionResponseStream]:
+    for data in iter_sse_data(response.content):
+        if data == b"[DONE]":
+            break
+        yield api._parse_json(CreateChatCompletionResponseStream, data)
+
+
+async def _aiter_chat_stream(
+    api: BaseAPI, response: APIResponse
+) -> AsyncIterator[CreateChatCompletionResponseStream]:
+    async for data in aiter_sse_data(response.content):
+        if data == b"[DONE]":
+            break
+        yield api._parse_json(CreateChatCompletionResponseStream, data)
 
 
 class ChatAPI(BaseAPI):
@@ -21,23 +206,14 @@ class ChatAPI(BaseAPI):
     https://add-docs.review.docs.asknews.app/en/reference#tag--chat
     """
 
+    __slots__ = ()
+
     def get_chat_completions(
         self,
         messages: List[Dict[str, str]],
-        model: Literal[
-            "gpt-4o-mini",
-            "gpt-4-1106-preview",
-            "open-mixtral-8x7b",
-            "meta-llama/Meta-Llama-3-70B-Instruct",
-            "meta-llama/Meta-Llama-3.1-70B-Instruct",
-            "meta-llama/Meta-Llama-3.3-70B-Instruct",
-            "meta-llama/Meta-Llama-3.1-405B-Instruct",
-            "claude-3-5-sonnet-20240620",
-            "claude-3-5-sonnet-latest",
-            "gpt-4o",
-        ] = "gpt-4o-mini",
+        model: ChatModel = "gpt-4o-mini",
         stream: bool = False,
-        inline_citations: Literal["markdown_link", "numbered", "none"] = "markdown_link",
+        inline_citations: InlineCitations = "markdown_link",
         append_references: bool = True,
         asknews_watermark: bool = True,
         journalist_mode: bool = True,
@@ -53,15 +229,12 @@ class ChatAPI(BaseAPI):
 
         :param messages: List of messages in the conversation.
         :type messages: List[Dict[str, str]]
-        :param model: Model to use for chat completion, defaults to "gpt-3.5-turbo-16k"
-        :type model: Literal[
-            "gpt-3.5-turbo-16k", "gpt-4-1106-preview", "mistral-small",
-            "mixtral-8x7b-32768"
-        ]
+        :param model: Model to use for chat completion, defaults to "gpt-4o-mini"
+        :type model: ChatModel
         :param stream: Whether to stream the response, defaults to False
         :type stream: bool
         :param inline_citations: Inline citations format, defaults to "markdown_link"
-        :type inline_citations: Literal["markdown_link", "numbered", "none"]
+        :type inline_citations: InlineCitations
         :param append_references: Whether to append references, defaults to True
         :type append_references: bool
         :param asknews_watermark: Whether to add AskNews watermark, defaults to True
@@ -75,43 +248,24 @@ class ChatAPI(BaseAPI):
             CreateChatCompletionResponse, Iterator[CreateChatCompletionResponseStream]
         ]
         """
-        response = self.client.request(
-            method="POST",
-            endpoint="/v1/openai/chat/completions",
-            body=CreateChatCompletionRequest(
-                messages=messages,
-                model=model,
-                stream=stream,
-                inline_citations=inline_citations,
-                append_references=append_references,
-                asknews_watermark=asknews_watermark,
-                journalist_mode=journalist_mode,
-                conversational_awareness=conversational_awareness,
-                filter_params=filter_params,
-            ).model_dump(mode="json"),
-            headers={
-                **(http_headers or {}),
-                "Content-Type": CreateChatCompletionRequest.__content_type__,
-            },
-            accept=[
-                (CreateChatCompletionResponse.__content_type__, 1.0),
-                (CreateChatCompletionResponseStream.__content_type__, 1.0),
-            ],
-            stream=stream,
-            stream_type="lines",
+        request = _build_chat_request(
+            messages,
+            model,
+            stream,
+            inline_citations,
+            append_references,
+            asknews_watermark,
+            journalist_mode,
+            conversational_awareness,
+            filter_params,
+            http_headers,
         )
+        response = self.client.request(**request)
 
         if stream:
-
-            def _stream():
-                for event in EventSource.from_api_response(response):
-                    if event.content == "[DONE]":
-                        break
-                    yield CreateChatCompletionResponseStream.model_validate_json(event.content)
-
-            return _stream()
+            return _iter_chat_stream(self, response)
         else:
-            return CreateChatCompletionResponse.model_validate(response.content)
+            return self._parse(CreateChatCompletionResponse, response)
 
     def list_chat_models(self, *, http_headers: Optional[Dict] = None) -> ListModelResponse:
         """
@@ -124,13 +278,17 @@ class ChatAPI(BaseAPI):
         :return: List of available chat models
         :rtype: ListModelResponse
         """
-        response = self.client.request(
-            method="GET",
-            endpoint="/v1/openai/models",
-            headers=http_headers,
-            accept=[(ListModelResponse.__content_type__, 1.0)],
-        )
-        return ListModelResponse.model_validate(response.content)
+
+        def _load() -> ListModelResponse:
+            response = self.client.request(
+                method="GET",
+                endpoint="/v1/openai/models",
+                headers=http_headers,
+                accept=_LIST_MODELS_ACCEPT,
+            )
+            return self._parse(ListModelResponse, response)
+
+        return self._cached_request(("list_chat_models",), _load, http_headers)
 
     def get_headline_questions(
         self,
@@ -154,29 +312,22 @@ class ChatAPI(BaseAPI):
             method="GET",
             endpoint="/v1/chat/questions",
             headers=http_headers,
-            query={"queries": queries},
+            query={"queries": queries} if queries else None,
         )
-        return HeadlineQuestionsResponse.model_validate(response.content)
+        return self._parse(HeadlineQuestionsResponse, response)
 
     def get_forecast(
         self,
         query: str,
         lookback: int = 14,
         articles_to_use: int = 14,
-        method: Literal["nl", "kw", "both"] = "kw",
-        model: Literal[
-            "gpt-4o",
-            "claude-3-5-sonnet-20240620",
-            "command-nightly",
-            "meta-llama/Meta-Llama-3.1-405B-Instruct",
-            "o1-mini",
-            "o1-preview",
-        ] = "claude-3-5-sonnet-20240620",
+        method: ForecastMethod = "kw",
+        model: ForecastModel = "claude-3-5-sonnet-20240620",
         cutoff_date: Optional[str] = None,
         use_reddit: bool = False,
         additional_context: Optional[str] = None,
         web_search: bool = False,
-        expert: Literal["general", "sports"] = "general",
+        expert: ForecastExpert = "general",
         *,
         http_headers: Optional[Dict] = None,
     ) -> ForecastResponse:
@@ -186,6 +337,8 @@ class ChatAPI(BaseAPI):
 
         https://docs.asknews.app/en/reference#get-/v1/chat/forecast
         """
+        _check_forecast_args(method, model, expert)
+
         response = self.client.request(
             method="GET",
             endpoint="/v1/chat/forecast",
@@ -203,7 +356,7 @@ class ChatAPI(BaseAPI):
                 "expert": expert,
             },
         )
-        return ForecastResponse.model_validate(response.content)
+        return self._parse(ForecastResponse, response)
 
     def live_web_search(
         self,
@@ -227,7 +380,7 @@ class ChatAPI(BaseAPI):
                 "lookback": lookback,
             },
         )
-        return WebSearchResponse.model_validate(response.content)
+        return self._parse(WebSearchResponse, response)
 
     def get_autofilter(
         self,
@@ -242,15 +395,19 @@ class ChatAPI(BaseAPI):
 
         https://docs.asknews.app/en/reference#get-/v1/chat/autofilter
         """
-        response = self.client.request(
-            method="GET",
-            endpoint="/v1/chat/autofilter",
-            headers=http_headers,
-            query={
-                "query": query,
-            },
-        )
-        return FilterParamsResponse.model_validate(response.content)
+
+        def _load() -> FilterParamsResponse:
+            response = self.client.request(
+                method="GET",
+                endpoint="/v1/chat/autofilter",
+                headers=http_headers,
+                query={
+                    "query": query,
+                },
+            )
+            return self._parse(FilterParamsResponse, response)
+
+        return self._cached_request(("autofilter", query), _load, http_headers)
 
 
 class AsyncChatAPI(BaseAPI):
@@ -258,25 +415,19 @@ class AsyncChatAPI(BaseAPI):
     Chat API
 
     https://api.asknews.app/docs#tag/chat
+
+    For many concurrent requests, call `asknews_sdk.install_fast_event_loop()`
+    before starting the event loop to run on uvloop (or winloop on Windows).
     """
 
+    __slots__ = ()
+
     async def get_chat_completions(
         self,
         messages: List[Dict[str, str]],
-        model: Literal[
-            "gpt-4o-mini",
-            "gpt-4-1106-preview",
-            "open-mixtral-8x7b",
-            "meta-llama/Meta-Llama-3-70B-Instruct",
-            "meta-llama/Meta-Llama-3.1-70B-Instruct",
-            "meta-llama/Meta-Llama-3.3-70B-Instruct",
-            "meta-llama/Meta-Llama-3.1-405B-Instruct",
-            "claude-3-5-sonnet-20240620",
-            "claude-3-5-sonnet-latest",
-            "gpt-4o",
-        ] = "gpt-4o-mini",
+        model: ChatModel = "gpt-4o-mini",
         stream: bool = False,
-        inline_citations: Literal["markdown_link", "numbered", "none"] = "markdown_link",
+        inline_citations: InlineCitations = "markdown_link",
         append_references: bool = True,
         asknews_watermark: bool = True,
         journalist_mode: bool = True,
@@ -292,15 +443,12 @@ class AsyncChatAPI(BaseAPI):
 
         :param messages: List of messages in the conversation.
         :type messages: List[Dict[str, str]]
-        :param model: Model to use for chat completion, defaults to "gpt-3.5-turbo-16k"
-        :type model: Literal[
-            "gpt-3.5-turbo-16k", "gpt-4-1106-preview", "mistral-small",
-            "mixtral-8x7b-32768"
-        ]
+        :param model: Model to use for chat completion, defaults to "gpt-4o-mini"
+        :type model: ChatModel
         :param stream: Whether to stream the response, defaults to False
         :type stream: bool
         :param inline_citations: Inline citations format, defaults to "markdown_link"
-        :type inline_citations: Literal["markdown_link", "numbered", "none"]
+        :type inline_citations: InlineCitations
         :param append_references: Whether to append references, defaults to True
         :type append_references: bool
         :param asknews_watermark: Whether to add AskNews watermark, defaults to True
@@ -315,43 +463,24 @@ class AsyncChatAPI(BaseAPI):
             AsyncIterator[CreateChatCompletionResponseStream]
         ]
         """
-        response = await self.client.request(
-            method="POST",
-            endpoint="/v1/openai/chat/completions",
-            body=CreateChatCompletionRequest(
-                messages=messages,
-                model=model,
-                stream=stream,
-                inline_citations=inline_citations,
-                append_references=append_references,
-                asknews_watermark=asknews_watermark,
-                journalist_mode=journalist_mode,
-                conversational_awareness=conversational_awareness,
-                filter_params=filter_params,
-            ).model_dump(mode="json"),
-            headers={
-                "Content-Type": CreateChatCompletionRequest.__content_type__,
-                **(http_headers or {}),
-            },
-            accept=[
-                (CreateChatCompletionResponse.__content_type__, 1.0),
-                (CreateChatCompletionResponseStream.__content_type__, 1.0),
-            ],
-            stream=stream,
-            stream_type="lines",
+        request = _build_chat_request(
+            messages,
+            model,
+            stream,
+            inline_citations,
+            append_references,
+            asknews_watermark,
+            journalist_mode,
+            conversational_awareness,
+            filter_params,
+            http_headers,
         )
+        response = await self.client.request(**request)
 
         if stream:
-
-            async def _stream():
-                async for event in EventSource.from_api_response(response):
-                    if event.content == "[DONE]":
-                        break
-                    yield CreateChatCompletionResponseStream.model_validate_json(event.content)
-
-            return _stream()
+            return _aiter_chat_stream(self, response)
         else:
-            return CreateChatCompletionResponse.model_validate(response.content)
+            return self._parse(CreateChatCompletionResponse, response)
 
     async def list_chat_models(self, *, http_headers: Optional[Dict] = None) -> ListModelResponse:
         """
@@ -364,13 +493,17 @@ class AsyncChatAPI(BaseAPI):
         :return: List of available chat models
         :rtype: ListModelResponse
         """
-        response = await self.client.request(
-            method="GET",
-            endpoint="/v1/openai/models",
-            headers=http_headers,
-            accept=[(ListModelResponse.__content_type__, 1.0)],
-        )
-        return ListModelResponse.model_validate(response.content)
+
+        async def _load() -> ListModelResponse:
+            response = await self.client.request(
+                method="GET",
+                endpoint="/v1/openai/models",
+                headers=http_headers,
+                accept=_LIST_MODELS_ACCEPT,
+            )
+            return self._parse(ListModelResponse, response)
+
+        return await self._acached_request(("list_chat_models",), _load, http_headers)
 
     async def get_headline_questions(
         self,
@@ -394,29 +527,58 @@ class AsyncChatAPI(BaseAPI):
             method="GET",
             endpoint="/v1/chat/questions",
             headers=http_headers,
-            query={"queries": queries},
+            query={"queries": queries} if queries else None,
+        )
+        return self._parse(HeadlineQuestionsResponse, response)
+
+    async def get_headline_questions_many(
+        self,
+        queries_list: List[Optional[List[str]]],
+        *,
+        max_concurrency: int = 8,
+        http_headers: Optional[Dict] = None,
+    ) -> List[HeadlineQuestionsResponse]:
+        """
+        Get headline questions for several lists of queries at once.
+
+        The requests are sent concurrently and share the client's connection
+        pool, or a single connection when HTTP/2 is enabled. Every list of
+        queries is validated before any request is sent.
+
+        https://docs.asknews.app/en/reference#get-/v1/chat/questions
+
+        :param queries_list: The lists of queries, one per request.
+        :type queries_list: List[Optional[List[str]]]
+        :param max_concurrency: The maximum number of requests in flight.
+        :type max_concurrency: int
+        :param http_headers: Additional HTTP headers.
+        :type http_headers: Optional[Dict]
+        :return: The headline questions, in the order of `queries_list`.
+        :rtype: List[HeadlineQuestionsResponse]
+        """
+        for queries in queries_list:
+            _check_headline_queries(queries)
+
+        return await self._gather(
+            (
+                partial(self.get_headline_questions, queries, http_headers=http_headers)
+                for queries in queries_list
+            ),
+            max_concurrency,
         )
-        return HeadlineQuestionsResponse.model_validate(response.content)
 
     async def get_forecast(
         self,
         query: str,
         lookback: int = 14,
         articles_to_use: int = 14,
-        method: Literal["nl", "kw", "both"] = "kw",
-        model: Literal[
-            "gpt-4o",
-            "claude-3-5-sonnet-20240620",
-            "command-nightly",
-            "meta-llama/Meta-Llama-3.1-405B-Instruct",
-            "o1-mini",
-            "o1-preview",
-        ] = "claude-3-5-sonnet-20240620",
+        method: ForecastMethod = "kw",
+        model: ForecastModel = "claude-3-5-sonnet-20240620",
         cutoff_date: Optional[str] = None,
         use_reddit: bool = False,
         additional_context: Optional[str] = None,
         web_search: bool = False,
-        expert: Literal["general", "sports"] = "general",
+        expert: ForecastExpert = "general",
         *,
         http_headers: Optional[Dict] = None,
     ) -> ForecastResponse:
@@ -426,6 +588,8 @@ class AsyncChatAPI(BaseAPI):
 
         https://docs.asknews.app/en/reference#get-/v1/chat/forecast
         """
+        _check_forecast_args(method, model, expert)
+
         response = await self.client.request(
             method="GET",
             endpoint="/v1/chat/forecast",
@@ -443,7 +607,7 @@ class AsyncChatAPI(BaseAPI):
                 "expert": expert,
             },
         )
-        return ForecastResponse.model_validate(response.content)
+        return self._parse(ForecastResponse, response)
 
     async def live_web_search(
         self,
@@ -467,7 +631,7 @@ class AsyncChatAPI(BaseAPI):
                 "lookback": lookback,
             },
         )
-        return WebSearchResponse.model_validate(response.content)
+        return self._parse(WebSearchResponse, response)
 
     async def get_autofilter(
         self,
@@ -482,12 +646,16 @@ class AsyncChatAPI(BaseAPI):
 
         https://docs.asknews.app/en/reference#get-/v1/chat/autofilter
         """
-        response = await self.client.request(
-            method="GET",
-            endpoint="/v1/chat/autofilter",
-            headers=http_headers,
-            query={
-                "query": query,
-            },
-        )
-        return FilterParamsResponse.model_validate(response.content)
+
+        async def _load() -> FilterParamsResponse:
+            response = await self.client.request(
+                method="GET",
+                endpoint="/v1/chat/autofilter",
+                headers=http_headers,
+                query={
+                    "query": query,
+                },
+            )
+            return self._parse(FilterParamsResponse, response)
+
+        return await self._acached_request(("autofilter", query), _load, http_headers)
@@ -1,4 +1,5 @@
-from typing import Dict, List, Literal, Optional, Union
+from functools import partial
+from typing import Dict, List, Literal, Optional, Sequence, Union, get_args
 from uuid import UUID
 
 from asknews_sdk.api.base import BaseAPI
@@ -11,6 +12,81 @@ from asknews_sdk.dto.news import (
 )
 
 
+Category = Literal[
+    "All",
+    "Business",
+    "Crime",
+    "Politics",
+    "Science",
+    "Sports",
+    "Technology",
+    "Military",
+    "Health",
+    "Entertainment",
+    "Finance",
+    "Culture",
+    "Climate",
+    "Environment",
+    "World",
+]
+TimeFilter = Literal["crawl_date", "pub_date"]
+ReturnType = Literal["string", "dicts", "both"]
+SearchMethod = Literal["nl", "kw", "both"]
+Strategy = Literal["latest news", "news knowledge", "default"]
+RedditMethod = Literal["nl", "kw"]
+RedditTimeFilter = Literal["all", "day", "hour", "month", "week", "year"]
+RedditSort = Literal["relevance", "hot", "top", "new", "comments"]
+
+_CATEGORIES = frozenset(get_args(Category))
+_TIME_FILTERS = frozenset(get_args(TimeFilter))
+_RETURN_TYPES = frozenset(get_args(ReturnType))
+_SEARCH_METHODS = frozenset(get_args(SearchMethod))
+_STRATEGIES = frozenset(get_args(Strategy))
+_REDDIT_METHODS = frozenset(get_args(RedditMethod))
+_REDDIT_TIME_FILTERS = frozenset(get_args(RedditTimeFilter))
+_REDDIT_SORTS = frozenset(get_args(RedditSort))
+_DEFAULT_CATEGORIES = ("All",)
+
+_ARTICLE_ACCEPT = ((ArticleResponse.__content_type__, 1.0),)
+_SEARCH_ACCEPT = ((SearchResponse.__content_type__, 1.0),)
+_SOURCE_REPORT_ACCEPT = ((SourceReportResponse.__content_type__, 1.0),)
+_REDDIT_ACCEPT = ((RedditResponse.__content_type__, 1.0),)
+_GRAPH_ACCEPT = ((GraphResponse.__content_type__, 1.0),)
+
+
+def _check_search_args(
+    time_filter: str,
+    return_type: str,
+    method: str,
+    strategy: str,
+    categories: Optional[Sequence[str]],
+) -> None:
+    if time_filter not in _TIME_FILTERS:
+        raise ValueError(f"Invalid time_filter: {time_filter}")
+    if return_type not in _RETURN_TYPES:
+        raise ValueError(f"Invalid return_type: {return_type}")
+    if method not in _SEARCH_METHODS:
+        raise ValueError(f"Invalid method: {method}")
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"Invalid strategy: {strategy}")
+    if categories is not None:
+        # A bare string is passed through as a single category
+        for category in (categories,) if isinstance(categories, str) else categories:
+            if category not in _CATEGORIES:
+                raise ValueError(f"Invalid category: {category}")
+
+
+def _check_reddit_args(method: str, return_type: str, time_filter: str, sort: str) -> None:
+    if method not in _REDDIT_METHODS:
+        raise ValueError(f"Invalid method: {method}")
+    if return_type not in _RETURN_TYPES:
+        raise ValueError(f"Invalid return_type: {return_type}")
+    if time_filter not in _REDDIT_TIME_FILTERS:
+        raise ValueError(f"Invalid time_filter: {time_filter}")
+    if sort not in _REDDIT_SORTS:
+        raise ValueError(f"Invalid sort: {sort}")
+
+
 class NewsAPI(BaseAPI):
     """
     News API
@@ -18,6 +94,8 @@ class NewsAPI(BaseAPI):
     https://docs.asknews.app/en/reference#tag--news
     """
 
+    __slots__ = ()
+
     def get_article(
         self, article_id: Union[str, UUID], *, http_headers: Optional[Dict] = None
     ) -> ArticleResponse:
@@ -33,14 +111,18 @@ class NewsAPI(BaseAPI):
         :return: The article response.
         :rtype: ArticleResponse
         """
-        response = self.client.request(
-            method="GET",
-            endpoint="/v1/news/{article_id}",
-            params={"article_id": article_id},
-            headers=http_headers,
-            accept=[(ArticleResponse.__content_type__, 1.0)],
-        )
-        return ArticleResponse.model_validate(response.content)
+        article_id = str(article_id)
+
+        def _load() -> ArticleResponse:
+            response = self.client.request(
+                method="GET",
+                endpoint=f"/v1/news/{article_id}",
+                headers=http_headers,
+                accept=_ARTICLE_ACCEPT,
+            )
+            return self._parse(ArticleResponse, response)
+
+        return self._cached_request(("article", article_id), _load, http_headers)
 
     def search_news(
         self,
@@ -48,33 +130,13 @@ class NewsAPI(BaseAPI):
         n_articles: int = 10,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-        time_filter: Literal["crawl_date", "pub_date"] = "crawl_date",
-        return_type: Literal["string", "dicts", "both"] = "string",
+        time_filter: TimeFilter = "crawl_date",
+        return_type: ReturnType = "string",
         historical: bool = False,
-        method: Literal["nl", "kw", "both"] = "kw",
+        method: SearchMethod = "kw",
         similarity_score_threshold: float = 0.5,
         offset: Union[int, str] = 0,
-        categories: Optional[
-            List[
-                Literal[
-                    "All",
-                    "Business",
-                    "Crime",
-                    "Politics",
-                    "Science",
-                    "Sports",
-                    "Technology",
-                    "Military",
-                    "Health",
-                    "Entertainment",
-                    "Finance",
-                    "Culture",
-                    "Climate",
-                    "Environment",
-                    "World",
-                ]
-            ]
-        ] = None,
+        categories: Optional[List[Category]] = None,
         doc_start_delimiter: str = "<doc>",
         doc_end_delimiter: str = "</doc>",
         provocative: Optional[str] = "all",
@@ -82,7 +144,7 @@ class NewsAPI(BaseAPI):
         domain_url: Optional[Union[List[str], str]] = None,
         page_rank: Optional[int] = None,
         diversify_sources: Optional[bool] = False,
-        strategy: Literal["latest news", "news knowledge", "default"] = "default",
+        strategy: Strategy = "default",
         hours_back: Optional[int] = 24,
         string_guarantee: Optional[List[str]] = None,
         string_guarantee_op: Optional[str] = "AND",
@@ -161,6 +223,8 @@ class NewsAPI(BaseAPI):
         :return: The search response.
         :rtype: SearchResponse
         """
+        _check_search_args(time_filter, return_type, method, strategy, categories)
+
         response = self.client.request(
             method="GET",
             endpoint="/v1/news/search",
@@ -174,7 +238,7 @@ class NewsAPI(BaseAPI):
                 "method": method,
                 "historical": historical,
                 "offset": offset,
-                "categories": categories if categories is not None else ["All"],
+                "categories": categories if categories is not None else _DEFAULT_CATEGORIES,
                 "similarity_score_threshold": similarity_score_threshold,
                 "doc_start_delimiter": doc_start_delimiter,
                 "doc_end_delimiter": doc_end_delimiter,
@@ -199,9 +263,9 @@ class NewsAPI(BaseAPI):
                 "premium": premium,
             },
             headers=http_headers,
-            accept=[(SearchResponse.__content_type__, 1.0)],
+            accept=_SEARCH_ACCEPT,
         )
-        return SearchResponse.model_validate(response.content)
+        return self._parse(SearchResponse, response)
 
     def get_sources_report(
         self,
@@ -244,19 +308,19 @@ class NewsAPI(BaseAPI):
                 "sampling": sampling,
             },
             headers=http_headers,
-            accept=[(SourceReportResponse.__content_type__, 1.0)],
+            accept=_SOURCE_REPORT_ACCEPT,
         )
-        return SourceReportResponse.model_validate(response.content)
+        return self._parse(SourceReportResponse, response)
 
     def search_reddit(
         self,
         keywords: List[str],
         n_threads: int = 5,
-        method: Literal["nl", "kw"] = "kw",
+        method: RedditMethod = "kw",
         deep: bool = True,
-        return_type: Literal["dicts", "string", "both"] = "string",
-        time_filter: Literal["all", "day", "hour", "month", "week", "year"] = "all",
-        sort: Literal["relevance", "hot", "top", "new", "comments"] = "relevance",
+        return_type: ReturnType = "string",
+        time_filter: RedditTimeFilter = "all",
+        sort: RedditSort = "relevance",
         *,
         http_headers: Optional[Dict] = None,
     ) -> RedditResponse:
@@ -264,6 +328,8 @@ class NewsAPI(BaseAPI):
         Search Reddit, summarize and analyze the threads,
         Return the list of threads and analyses.
         """
+        _check_reddit_args(method, return_type, time_filter, sort)
+
         response = self.client.request(
             method="GET",
             endpoint="/v1/reddit/search",
@@ -277,9 +343,9 @@ class NewsAPI(BaseAPI):
                 "sort": sort,
             },
             headers=http_headers,
-            accept=[(RedditResponse.__content_type__, 1.0)],
+            accept=_REDDIT_ACCEPT,
         )
-        return RedditResponse.model_validate(response.content)
+        return self._parse(RedditResponse, response)
 
     def build_graph(
         self,
@@ -308,9 +374,9 @@ class NewsAPI(BaseAPI):
                 "visualize_with": visualize_with,
             },
             headers=http_headers,
-            accept=[(GraphResponse.__content_type__, 1.0)],
+            accept=_GRAPH_ACCEPT,
         )
-        return GraphResponse.model_validate(response.content)
+        return self._parse(GraphResponse, response)
 
 
 class AsyncNewsAPI(BaseAPI):
@@ -320,12 +386,17 @@ class AsyncNewsAPI(BaseAPI):
     https://docs.asknews.app/en/reference#tag--news
     """
 
+    __slots__ = ()
+
     async def get_article(
         self, article_id: Union[str, UUID], *, http_headers: Optional[Dict] = None
     ):
         """
         Get a news article by its UUID.
 
+        To fetch several articles, use `get_articles` instead of awaiting this
+        in a loop.
+
         https://docs.asknews.app/en/reference#get-/v1/news/-article_id-
 
         :param article_id: The UUID of the article.
@@ -335,14 +406,50 @@ class AsyncNewsAPI(BaseAPI):
         :return: The article response.
         :rtype: ArticleResponse
         """
-        response = await self.client.request(
-            method="GET",
-            endpoint="/v1/news/{article_id}",
-            params={"article_id": article_id},
-            headers=http_headers,
-            accept=[(ArticleResponse.__content_type__, 1.0)],
+        article_id = str(article_id)
+
+        async def _load() -> ArticleResponse:
+            response = await self.client.request(
+                method="GET",
+                endpoint=f"/v1/news/{article_id}",
+                headers=http_headers,
+                accept=_ARTICLE_ACCEPT,
+            )
+            return self._parse(ArticleResponse, response)
+
+        return await self._acached_request(("article", article_id), _load, http_headers)
+
+    async def get_articles(
+        self,
+        article_ids: List[Union[str, UUID]],
+        *,
+        max_concurrency: int = 8,
+        http_headers: Optional[Dict] = None,
+    ) -> List[ArticleResponse]:
+        """
+        Get several news articles by their UUIDs at once.
+
+        The API serves one article per request, so the requests are sent
+        concurrently and share the client's connection pool.
+
+        https://docs.asknews.app/en/reference#get-/v1/news/-article_id-
+
+        :param article_ids: The UUIDs of the articles.
+        :type article_ids: List[Union[str, UUID]]
+        :param max_concurrency: The maximum number of requests in flight.
+        :type max_concurrency: int
+        :param http_headers: Additional HTTP headers.
+        :type http_headers: Optional[Dict]
+        :return: The article responses, in the order of `article_ids`.
+        :rtype: List[ArticleResponse]
+        """
+        return await self._gather(
+            (
+                partial(self.get_article, article_id, http_headers=http_headers)
+                for article_id in article_ids
+            ),
+            max_concurrency,
         )
-        return ArticleResponse.model_validate(response.content)
 
     async def search_news(
         self,
@@ -350,33 +457,13 @@ class AsyncNewsAPI(BaseAPI):
         n_articles: int = 10,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-        time_filter: Literal["crawl_date", "pub_date"] = "crawl_date",
-        return_type: Literal["string", "dicts", "both"] = "string",
+        time_filter: TimeFilter = "crawl_date",
+        return_type: ReturnType = "string",
         historical: bool = False,
-        method: Literal["nl", "kw", "both"] = "kw",
+        method: SearchMethod = "kw",
         similarity_score_threshold: float = 0.5,
         offset: Union[int, str] = 0,
-        categories: Optional[
-            List[
-                Literal[
-                    "All",
-                    "Business",
-                    "Crime",
-                    "Politics",
-                    "Science",
-                    "Sports",
-                    "Technology",
-                    "Military",
-                    "Health",
-                    "Entertainment",
-                    "Finance",
-                    "Culture",
-                    "Climate",
-                    "Environment",
-                    "World",
-                ]
-            ]
-        ] = None,
+        categories: Optional[List[Category]] = None,
         doc_start_delimiter: str = "<doc>",
         doc_end_delimiter: str = "</doc>",
         provocative: Optional[str] = "all",
@@ -384,7 +471,7 @@ class AsyncNewsAPI(BaseAPI):
         domain_url: Optional[Union[List[str], str]] = None,
         page_rank: Optional[int] = None,
         diversify_sources: Optional[bool] = False,
-        strategy: Literal["latest news", "news knowledge", "default"] = "default",
+        strategy: Strategy = "default",
         hours_back: Optional[int] = 24,
         string_guarantee: Optional[List[str]] = None,
         string_guarantee_op: Optional[str] = "AND",
@@ -463,6 +550,8 @@ class AsyncNewsAPI(BaseAPI):
         :return: The search response.
         :rtype: SearchResponse
         """
+        _check_search_args(time_filter, return_type, method, strategy, categories)
+
         response = await self.client.request(
             method="GET",
             endpoint="/v1/news/search",
@@ -476,7 +565,7 @@ class AsyncNewsAPI(BaseAPI):
                 "method": method,
                 "historical": historical,
                 "offset": offset,
-                "categories": categories if categories is not None else ["All"],
+                "categories": categories if categories is not None else _DEFAULT_CATEGORIES,
                 "similarity_score_threshold": similarity_score_threshold,
                 "doc_start_delimiter": doc_start_delimiter,
                 "doc_end_delimiter": doc_end_delimiter,
@@ -501,9 +590,9 @@ class AsyncNewsAPI(BaseAPI):
                 "premium": premium,
             },
             headers=http_headers,
-            accept=[(SearchResponse.__content_type__, 1.0)],
+            accept=_SEARCH_ACCEPT,
         )
-        return SearchResponse.model_validate(response.content)
+        return self._parse(SearchResponse, response)
 
     async def get_sources_report(
         self,
@@ -546,19 +635,19 @@ class AsyncNewsAPI(BaseAPI):
                 "sampling": sampling,
             },
             headers=http_headers,
-            accept=[(SourceReportResponse.__content_type__, 1.0)],
+            accept=_SOURCE_REPORT_ACCEPT,
         )
-        return SourceReportResponse.model_validate(response.content)
+        return self._parse(SourceReportResponse, response)
 
     async def search_reddit(
         self,
         keywords: List[str],
         n_threads: int = 5,
-        method: Literal["nl", "kw"] = "kw",
+        method: RedditMethod = "kw",
         deep: bool = True,
-        return_type: Literal["dicts", "string", "both"] = "string",
-        time_filter: Literal["all", "day", "hour", "month", "week", "year"] = "all",
-        sort: Literal["relevance", "hot", "top", "new", "comments"] = "relevance",
+        return_type: ReturnType = "string",
+        time_filter: RedditTimeFilter = "all",
+        sort: RedditSort = "relevance",
         *,
         http_headers: Optional[Dict] = None,
     ) -> RedditResponse:
@@ -566,6 +655,8 @@ class AsyncNewsAPI(BaseAPI):
         Search Reddit, summarize and analyze the threads,
         Return the list of threads and analyses.
         """
+        _check_reddit_args(method, return_type, time_filter, sort)
+
         response = await self.client.request(
             method="GET",
             endpoint="/v1/reddit/search",
@@ -579,9 +670,9 @@ class AsyncNewsAPI(BaseAPI):
                 "sort": sort,
             },
             headers=http_headers,
-            accept=[(RedditResponse.__content_type__, 1.0)],
+            accept=_REDDIT_ACCEPT,
         )
-        return RedditResponse.model_validate(response.content)
+        return self._parse(RedditResponse, response)
 
     async def build_graph(
         self,
@@ -610,6 +701,6 @@ class AsyncNewsAPI(BaseAPI):
                 "visualize_with": visualize_with,
             },
             headers=http_headers,
-            accept=[(GraphResponse.__content_type__, 1.0)],
+            accept=_GRAPH_ACCEPT,
         )
-        return GraphResponse.model_validate(response.content)
+        return self._parse(GraphResponse, response)
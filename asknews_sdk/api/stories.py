@@ -5,6 +5,42 @@ from asknews_sdk.api.base import BaseAPI
 from asknews_sdk.dto.stories import StoriesResponse, StoryResponse
 
 
+Category = Literal[
+    "Politics",
+    "Economy",
+    "Finance",
+    "Science",
+    "Technology",
+    "Sports",
+    "Climate",
+    "Environment",
+    "Culture",
+    "Entertainment",
+    "Business",
+    "Health",
+    "International",
+]
+Continent = Literal[
+    "Africa",
+    "Asia",
+    "Europe",
+    "Middle East",
+    "North America",
+    "South America",
+    "Oceania",
+]
+SortBy = Literal["published", "coverage", "sentiment", "confidence", "relevance"]
+SortType = Literal["asc", "desc"]
+SearchMethod = Literal["nl", "kw", "both"]
+ObjectType = Literal["story", "story_update"]
+Provocative = Literal["unknown", "low", "medium", "high", "all"]
+CitationMethod = Literal["brackets", "urls", "none"]
+Strategy = Literal["default", "topstories", "topstories_continents", "topstories_categories"]
+
+_STORIES_ACCEPT = ((StoriesResponse.__content_type__, 1.0),)
+_STORY_ACCEPT = ((StoryResponse.__content_type__, 1.0),)
+
+
 class StoriesAPI(BaseAPI):
     """
     Stories API
@@ -12,59 +48,29 @@ class StoriesAPI(BaseAPI):
     https://docs.asknews.app/en/reference#tag--stories
     """
 
+    __slots__ = ()
+
     def search_stories(
         self,
         query: Optional[str] = None,
-        categories: Optional[
-            List[
-                Literal[
-                    "Politics",
-                    "Economy",
-                    "Finance",
-                    "Science",
-                    "Technology",
-                    "Sports",
-                    "Climate",
-                    "Environment",
-                    "Culture",
-                    "Entertainment",
-                    "Business",
-                    "Health",
-                    "International",
-                ]
-            ]
-        ] = None,
+        categories: Optional[List[Category]] = None,
         uuids: Optional[List[UUID]] = None,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-        sort_by: Optional[
-            Literal["published", "coverage", "sentiment", "confidence", "relevance"]
-        ] = None,
-        sort_type: Optional[Literal["asc", "desc"]] = None,
-        continent: Optional[
-            Literal[
-                "Africa",
-                "Asia",
-                "Europe",
-                "Middle East",
-                "North America",
-                "South America",
-                "Oceania",
-            ]
-        ] = None,
+        sort_by: Optional[SortBy] = None,
+        sort_type: Optional[SortType] = None,
+        continent: Optional[Continent] = None,
         offset: Optional[Union[int, str]] = None,
         limit: int = 50,
         expand_updates: bool = False,
         max_updates: int = 11,
         max_articles: int = 5,
         reddit: int = 0,
-        method: Literal["nl", "kw", "both"] = "kw",
-        obj_type: Optional[List[Literal["story", "story_update"]]] = None,
-        provocative: Literal["unknown", "low", "medium", "high", "all"] = "all",
-        citation_method: Literal["brackets", "urls", "none"] = "brackets",
-        strategy: Literal[
-            "default", "topstories", "topstories_continents", "topstories_categories"
-        ] = "default",
+        method: SearchMethod = "kw",
+        obj_type: Optional[List[ObjectType]] = None,
+        provocative: Provocative = "all",
+        citation_method: CitationMethod = "brackets",
+        strategy: Strategy = "default",
         *,
         http_headers: Optional[Dict] = None,
     ) -> StoriesResponse:
@@ -135,10 +141,10 @@ class StoriesAPI(BaseAPI):
                 "strategy": strategy,
             },
             headers=http_headers,
-            accept=[(StoriesResponse.__content_type__, 1.0)],
+            accept=_STORIES_ACCEPT,
         )
 
-        return StoriesResponse.model_validate(response.content)
+        return self._parse(StoriesResponse, response)
 
     def get_story(
         self,
@@ -147,7 +153,7 @@ class StoriesAPI(BaseAPI):
         max_updates: int = 11,
         max_articles: int = 5,
         reddit: int = 0,
-        citation_method: Literal["brackets", "urls", "none"] = "brackets",
+        citation_method: CitationMethod = "brackets",
         condense_auxillary_updates: bool = False,
         *,
         http_headers: Optional[Dict] = None,
@@ -178,7 +184,7 @@ class StoriesAPI(BaseAPI):
         """
         response = self.client.request(
             method="GET",
-            endpoint="/v1/stories/{story_id}",
+            endpoint=f"/v1/stories/{story_id}",
             query={
                 "expand_updates": expand_updates,
                 "max_updates": max_updates,
@@ -187,11 +193,10 @@ class StoriesAPI(BaseAPI):
                 "citation_method": citation_method,
                 "condense_auxillary_updates": condense_auxillary_updates,
             },
-            params={"story_id": story_id},
             headers=http_headers,
-            accept=[(StoryResponse.__content_type__, 1.0)],
+            accept=_STORY_ACCEPT,
         )
-        return StoryResponse.model_validate(response.content)
+        return self._parse(StoryResponse, response)
 
 
 class AsyncStoriesAPI(BaseAPI):
@@ -201,59 +206,29 @@ class AsyncStoriesAPI(BaseAPI):
     https://docs.asknews.app/en/reference#tag--stories
     """
 
+    __slots__ = ()
+
     async def search_stories(
         self,
         query: Optional[str] = None,
-        categories: Optional[
-            List[
-                Literal[
-                    "Politics",
-                    "Economy",
-                    "Finance",
-                    "Science",
-                    "Technology",
-                    "Sports",
-                    "Climate",
-                    "Environment",
-                    "Culture",
-                    "Entertainment",
-                    "Business",
-                    "Health",
-                    "International",
-                ]
-            ]
-        ] = None,
+        categories: Optional[List[Category]] = None,
         uuids: Optional[List[UUID]] = None,
         start_timestamp: Optional[int] = None,
         end_timestamp: Optional[int] = None,
-        sort_by: Optional[
-            Literal["published", "coverage", "sentiment", "relevance", "confidence"]
-        ] = None,
-        sort_type: Optional[Literal["asc", "desc"]] = None,
-        continent: Optional[
-            Literal[
-                "Africa",
-                "Asia",
-                "Europe",
-                "Middle East",
-                "North America",
-                "South America",
-                "Oceania",
-            ]
-        ] = None,
+        sort_by: Optional[SortBy] = None,
+        sort_type: Optional[SortType] = None,
+        continent: Optional[Continent] = None,
         offset: Optional[Union[int, str]] = None,
         limit: int = 50,
         expand_updates: bool = False,
         max_updates: int = 11,
         max_articles: int = 5,
         reddit: int = 0,
-        method: Literal["nl", "kw", "both"] = "kw",
-        obj_type: Optional[List[Literal["story", "story_update"]]] = None,
-        provocative: Literal["unknown", "low", "medium", "high", "all"] = "all",
-        citation_method: Literal["brackets", "urls", "none"] = "brackets",
-        strategy: Literal[
-            "default", "topstories", "topstories_continents", "topstories_categories"
-        ] = "default",
+        method: SearchMethod = "kw",
+        obj_type: Optional[List[ObjectType]] = None,
+        provocative: Provocative = "all",
+        citation_method: CitationMethod = "brackets",
+        strategy: Strategy = "default",
         *,
         http_headers: Optional[Dict] = None,
     ) -> StoriesResponse:
@@ -324,10 +299,10 @@ class AsyncStoriesAPI(BaseAPI):
                 "strategy": strategy,
             },
             headers=http_headers,
-            accept=[(StoriesResponse.__content_type__, 1.0)],
+            accept=_STORIES_ACCEPT,
         )
 
-        return StoriesResponse.model_validate(response.content)
+        return self._parse(StoriesResponse, response)
 
     async def get_story(
         self,
@@ -336,7 +311,7 @@ class AsyncStoriesAPI(BaseAPI):
         max_updates: int = 11,
         max_articles: int = 5,
         reddit: int = 0,
-        citation_method: Literal["brackets", "urls", "none"] = "brackets",
+        citation_method: CitationMethod = "brackets",
         condense_auxillary_updates: bool = False,
         *,
         http_headers: Optional[Dict] = None,
@@ -367,7 +342,7 @@ class AsyncStoriesAPI(BaseAPI):
         """
         response = await self.client.request(
             method="GET",
-            endpoint="/v1/stories/{story_id}",
+            endpoint=f"/v1/stories/{story_id}",
             query={
                 "expand_updates": expand_updates,
                 "max_updates": max_updates,
@@ -376,8 +351,7 @@ class AsyncStoriesAPI(BaseAPI):
                 "citation_method": citation_method,
                 "condense_auxillary_updates": condense_auxillary_updates,
             },
-            params={"story_id": story_id},
             headers=http_headers,
-            accept=[(StoryResponse.__content_type__, 1.0)],
+            accept=_STORY_ACCEPT,
         )
-        return StoryResponse.model_validate(response.content)
+        return self._parse(StoryResponse, response)
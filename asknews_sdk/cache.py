@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Hashable, Optional, Tuple
+
+
+class _Missing:
+    def __repr__(self):
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+
+
+class TTLCache:
+    """
+    A bounded in-memory cache whose entries expire after a time-to-live.
+
+    Entries are stored as ``(expires_at, value)`` and are only checked for
+    expiry when they are accessed. Expired entries are kept around until they
+    are overwritten or pushed out by newer entries, so they can still be served
+    as a stale fallback. Access is guarded by a lock so a cache can be shared
+    across threads.
+
+    :param maxsize: The maximum number of entries to keep.
+    :type maxsize: int
+    :param ttl: The default time-to-live in seconds.
+    :type ttl: float
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not MISSING
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Get a fresh value from the cache.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param default: The value to return on a miss.
+        :type default: Any
+        :return: The cached value, or `default` if missing or expired.
+        :rtype: Any
+        """
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None or entry[0] <= monotonic():
+                return default
+
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def get_stale(self, key: Hashable, default: Any = MISSING) -> Any:
+        """
+        Get a value from the cache regardless of whether it has expired.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param default: The value to return on a miss.
+        :type default: Any
+        :return: The cached value, or `default` if missing.
+        :rtype: Any
+        """
+        with self._lock:
+            entry = self._data.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value in the cache.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param value: The value to store.
+        :type value: Any
+        :param ttl: The time-to-live in seconds, defaults to the cache TTL.
+        :type ttl: Optional[float]
+        """
+        with self._lock:
+            self._data[key] = (monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a value from the cache.
+
+        :param key: The cache key.
+        :type key: Hashable
+        :param default: The value to return if the key is missing.
+        :type default: Any
+        :return: The removed value.
+        :rtype: Any
+        """
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """
+        Remove all values from the cache.
+        """
+        with self._lock:
+            self._data.clear()
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import (
     Any,
     Dict,
-    List,
     Optional,
+    Sequence,
     Set,
+    Tuple,
     Type,
     Union,
 )
 
-from httpx import AsyncClient, Client, HTTPStatusError, Request, Response
+from httpx import AsyncClient, Client, HTTPStatusError, Limits, Request, Response
 
 from asknews_sdk.errors import raise_from_response
 from asknews_sdk.response import APIResponse
@@ -32,7 +34,9 @@ from asknews_sdk.version import __version__
 
 
 USER_AGENT = f"asknews-sdk-python/{__version__}"
-
+HTTP2_AVAILABLE = find_spec("h2") is not None
+DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+DEFAULT_ACCEPT = (("application/json", 1.0),)
 
 
 class BaseAPIClient:
@@ -87,6 +91,10 @@ class BaseAPIClient:
                 self._client_auth = auth
 
         if isinstance(client, type):
+            # Multiplex concurrent requests over one connection when h2 is
+            # installed, and keep enough connections alive for bursts.
+            kwargs.setdefault("http2", HTTP2_AVAILABLE)
+            kwargs.setdefault("limits", DEFAULT_LIMITS)
             self._client = client(
                 base_url=self.base_url,
                 verify=self.verify_ssl,
@@ -107,15 +115,21 @@ class BaseAPIClient:
         query: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         params: Optional[Dict] = None,
-        accept: Optional[List[tuple[str, float]]] = None,
+        accept: Optional[Sequence[Tuple[str, float]]] = None,
     ) -> Request:
-        headers = headers or {}
-        content_type = headers.pop("content-type", determine_content_type(body)) if body else None
+        # Copy so neither the caller's headers nor shared defaults are mutated
+        headers = dict(headers) if headers else {}
+
+        if body:
+            content_type = determine_content_type(body)
+
+            # An explicit Content-Type wins regardless of how it is cased
+            for key in [key for key in headers if key.lower() == "content-type"]:
+                content_type = headers.pop(key)
 
-        if content_type:
             headers["content-type"] = content_type
 
-        headers["accept"] = build_accept_header(accept or [("application/json", 1.0)])
+        headers["accept"] = build_accept_header(accept or DEFAULT_ACCEPT)
 
         return Request(
             method=method,
@@ -214,7 +228,7 @@ class APIClient(BaseAPIClient):
         query: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         params: Optional[Dict] = None,
-        accept: Optional[List[tuple[str, float]]] = None,
+        accept: Optional[Sequence[Tuple[str, float]]] = None,
         stream: bool = False,
         stream_type: StreamType = "bytes",
     ) -> APIResponse:
@@ -234,7 +248,7 @@ class APIClient(BaseAPIClient):
         :param params: Path parameters
         :type params: Optional[Dict]
         :param accept: Accept header
-        :type accept: Optional[List[tuple[str, float]]]
+        :type accept: Optional[Sequence[Tuple[str, float]]]
         :param stream: Stream response content
         :type stream: bool
         :param stream_type: Stream type
@@ -357,7 +371,7 @@ class AsyncAPIClient(BaseAPIClient):
         query: Optional[Dict] = None,
         headers: Optional[Dict] = None,
         params: Optional[Dict] = None,
-        accept: Optional[List[tuple[str, float]]] = None,
+        accept: Optional[Sequence[Tuple[str, float]]] = None,
         stream: bool = False,
         stream_type: StreamType = "bytes",
     ) -> APIResponse:
@@ -377,7 +391,7 @@ class AsyncAPIClient(BaseAPIClient):
         :param params: Path parameters
         :type params: Optional[Dict]
         :param accept: Accept header
-        :type accept: Optional[List[tuple[str, float]]]
+        :type accept: Optional[Sequence[Tuple[str, float]]]
         :param stream: Stream response content
         :type stream: bool
         :param stream_type: Stream type
@@ -143,6 +143,8 @@ class WebSearchResponse(BaseModel):
 
 
 class ForecastResponse(BaseModel):
+    model_config = ConfigDict(protected_namespaces=())
+
     forecast: str
     resolution_criteria: str
     date: datetime
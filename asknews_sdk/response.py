@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, AsyncIterator, Dict, Iterator, Union
+from functools import cached_property
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from httpx import Request, Response
 
@@ -28,7 +29,16 @@ class APIResponse:
         self.content_type, *_ = parse_content_type(
             headers.get("content-type", "application/json")
         )
-        self.content = self._deserialize_body() if not self.stream else self.body
+
+    @cached_property
+    def content(self) -> Any:
+        """
+        The response body, deserialized according to its content type.
+
+        The body is only deserialized on first access, so callers that
+        parse the raw `body` bytes directly never pay for it.
+        """
+        return self._deserialize_body() if not self.stream else self.body
 
     def _deserialize_body(self) -> Any:
         if self.content_type == "application/octet-stream":
@@ -123,6 +133,11 @@ class EventSource:
                 self.current_event = ServerSentEvent()
 
     def parse_line(self, line: str) -> None:
+        # Most lines are data, so handle them in a single slice and strip
+        if line.startswith("data:"):
+            self.current_event.data.append(line[5:].strip())
+            return
+
         if line.startswith(":"):
             return
 
@@ -161,3 +176,100 @@ class EventSource:
                 f"got: {response.content_type}"
             )
         return cls(response.content)
+
+
+def _event_data(frame: bytes) -> Optional[bytes]:
+    # Fast path for the common single `data: ...` line event
+    if frame.startswith(b"data:") and b"\n" not in frame:
+        return frame[5:].strip()
+
+    data = [line[5:].strip() for line in frame.split(b"\n") if line.startswith(b"data:")]
+    return b"\n".join(data) if data else None
+
+
+class SSEDecoder:
+    """
+    Incremental decoder for the data of Server-Sent Events.
+
+    Raw chunks are split into events with `bytes.find` instead of decoding
+    and parsing every line as `EventSource` does, and only the `data` field
+    of each event is kept. The same decoder backs the sync and async
+    iterators.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """
+        Feed a chunk of the stream.
+
+        :param chunk: Raw response bytes
+        :type chunk: bytes
+        :return: The data of every event completed by this chunk
+        :rtype: List[bytes]
+        """
+        buffer = self._buffer + chunk
+
+        if b"\r" in buffer:
+            buffer = buffer.replace(b"\r\n", b"\n")
+
+        events = []
+        start = 0
+
+        while (end := buffer.find(b"\n\n", start)) != -1:
+            if (data := _event_data(buffer[start:end])) is not None:
+                events.append(data)
+            start = end + 2
+
+        self._buffer = buffer[start:]
+        return events
+
+    def flush(self) -> List[bytes]:
+        """
+        Flush a trailing event that was not closed by a blank line.
+
+        :return: The data of the trailing event, if any
+        :rtype: List[bytes]
+        """
+        data = _event_data(self._buffer.strip())
+        self._buffer = b""
+        return [] if data is None else [data]
+
+
+def iter_sse_data(iterator: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    Yield the data of each Server-Sent Event in a byte stream.
+
+    :param iterator: Iterator of raw response bytes
+    :type iterator: Iterator[bytes]
+    :return: Iterator of event data
+    :rtype: Iterator[bytes]
+    """
+    decoder = SSEDecoder()
+
+    for chunk in iterator:
+        yield from decoder.feed(chunk)
+
+    yield from decoder.flush()
+
+
+async def aiter_sse_data(iterator: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Yield the data of each Server-Sent Event in an asynchronous byte stream.
+
+    :param iterator: Asynchronous iterator of raw response bytes
+    :type iterator: AsyncIterator[bytes]
+    :return: Asynchronous iterator of event data
+    :rtype: AsyncIterator[bytes]
+    """
+    decoder = SSEDecoder()
+
+    async for chunk in iterator:
+        for data in decoder.feed(chunk):
+            yield data
+
+    for data in decoder.flush():
+        yield data
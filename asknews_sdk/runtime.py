@@ -0,0 +1,36 @@
+import asyncio
+import sys
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Install a faster event loop policy if one is available.
+
+    Uses winloop on Windows and uvloop elsewhere, both of which can be installed
+    with the ``fast`` extra. Once installed, every loop created afterwards (e.g.
+    by ``asyncio.run``) uses the faster implementation, so all
+    ``AsyncAskNewsSDK`` calls benefit without further changes. This is never
+    done automatically so an existing loop choice is always respected.
+
+    On Python 3.12+ ``uvloop.install()`` is deprecated, so the policy is set
+    directly instead. Event loop policies are themselves deprecated from Python
+    3.14, so on 3.12+ prefer running your entrypoint with ``uvloop.run(main())``
+    (or ``winloop.run(main())``) over calling this function.
+
+    :return: Whether a faster event loop policy was installed.
+    :rtype: bool
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_module
+        else:
+            import uvloop as loop_module
+    except ImportError:
+        return False
+
+    if sys.version_info >= (3, 12):
+        asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+    else:
+        loop_module.install()
+
+    return True
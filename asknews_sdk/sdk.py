@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Set, Type, Union
+from typing import Dict, Optional, Set, Type, Union
 
 from httpx import AsyncClient, Client
 
@@ -14,6 +14,7 @@ from asknews_sdk.api import (
     NewsAPI,
     StoriesAPI,
 )
+from asknews_sdk.cache import TTLCache
 from asknews_sdk.client import APIClient, AsyncAPIClient
 from asknews_sdk.dto.base import PingResponse
 from asknews_sdk.security import (
@@ -61,6 +62,18 @@ class AskNewsSDK:
     :type follow_redirects: bool
     :param client: The HTTP client to use.
     :type client: Union[Type[Client], Client]
+    :param cache: An optional cache for responses of idempotent endpoints.
+        Requests made with extra `http_headers` bypass the cache.
+    :type cache: Optional[TTLCache]
+    :param cache_ttls: Per-endpoint TTLs in seconds, overriding the cache TTL.
+    :type cache_ttls: Optional[Dict[str, float]]
+    :param serve_stale: Whether to return an expired cached response when a
+        request fails.
+    :type serve_stale: bool
+    :param validate_responses: Whether to validate responses against their models.
+        Disabling this skips validation for faster parsing of trusted responses.
+        Defaults to validating unless `ASKNEWS_TRUST_SERVER=1` is set.
+    :type validate_responses: Optional[bool]
     :param kwargs: Additional keyword arguments to pass to the HTTP client.
     :type kwargs: Any
     """
@@ -79,6 +92,10 @@ class AskNewsSDK:
         client: Union[Type[Client], Client] = Client,
         auth: Optional[RequestAuth | Sentinel] = CLIENT_DEFAULT,
         *,
+        cache: Optional[TTLCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        serve_stale: bool = False,
+        validate_responses: Optional[bool] = None,
         _token_load_hook: Optional[TokenLoadHook] = None,
         _token_save_hook: Optional[TokenSaveHook] = None,
         **kwargs,
@@ -100,10 +117,34 @@ class AskNewsSDK:
             **kwargs,
         )
 
-        self.analytics = AnalyticsAPI(self.client)
-        self.stories = StoriesAPI(self.client)
-        self.news = NewsAPI(self.client)
-        self.chat = ChatAPI(self.client)
+        self.analytics = AnalyticsAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+        )
+        self.stories = StoriesAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+        )
+        self.news = NewsAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+        )
+        self.chat = ChatAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+        )
 
     def __enter__(self) -> AskNewsSDK:
         return self
@@ -125,7 +166,7 @@ class AskNewsSDK:
         :rtype: PingResponse
         """
         response = self.client.request(method="GET", endpoint="/")
-        return PingResponse.model_validate(response.content)
+        return PingResponse.model_validate_json(response.body)
 
 
 class AsyncAskNewsSDK:
@@ -159,6 +200,21 @@ class AsyncAskNewsSDK:
     :type follow_redirects: bool
     :param client: The HTTP client to use.
     :type client: Union[Type[AsyncClient], AsyncClient]
+    :param cache: An optional cache for responses of idempotent endpoints.
+        Requests made with extra `http_headers` bypass the cache.
+    :type cache: Optional[TTLCache]
+    :param cache_ttls: Per-endpoint TTLs in seconds, overriding the cache TTL.
+    :type cache_ttls: Optional[Dict[str, float]]
+    :param serve_stale: Whether to return an expired cached response when a
+        request fails.
+    :type serve_stale: bool
+    :param validate_responses: Whether to validate responses against their models.
+        Disabling this skips validation for faster parsing of trusted responses.
+        Defaults to validating unless `ASKNEWS_TRUST_SERVER=1` is set.
+    :type validate_responses: Optional[bool]
+    :param coalesce_requests: Whether concurrent identical requests to idempotent
+        endpoints share a single request and response when no cache is set.
+    :type coalesce_requests: bool
     :param kwargs: Additional keyword arguments to pass to the HTTP client.
     :type kwargs: Any
     """
@@ -177,6 +233,11 @@ class AsyncAskNewsSDK:
         client: Union[Type[AsyncClient], AsyncClient] = AsyncClient,
         auth: Optional[RequestAuth | Sentinel] = CLIENT_DEFAULT,
         *,
+        cache: Optional[TTLCache] = None,
+        cache_ttls: Optional[Dict[str, float]] = None,
+        serve_stale: bool = False,
+        validate_responses: Optional[bool] = None,
+        coalesce_requests: bool = False,
         _token_load_hook: Optional[AsyncTokenLoadHook] = None,
         _token_save_hook: Optional[AsyncTokenSaveHook] = None,
         **kwargs,
@@ -198,10 +259,38 @@ class AsyncAskNewsSDK:
             **kwargs,
         )
 
-        self.analytics = AsyncAnalyticsAPI(self.client)
-        self.stories = AsyncStoriesAPI(self.client)
-        self.news = AsyncNewsAPI(self.client)
-        self.chat = AsyncChatAPI(self.client)
+        self.analytics = AsyncAnalyticsAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+            coalesce_requests=coalesce_requests,
+        )
+        self.stories = AsyncStoriesAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+            coalesce_requests=coalesce_requests,
+        )
+        self.news = AsyncNewsAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+            coalesce_requests=coalesce_requests,
+        )
+        self.chat = AsyncChatAPI(
+            self.client,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            serve_stale=serve_stale,
+            validate_responses=validate_responses,
+            coalesce_requests=coalesce_requests,
+        )
 
     async def __aenter__(self) -> AsyncAskNewsSDK:
         return self
@@ -223,4 +312,4 @@ class AsyncAskNewsSDK:
         :rtype: PingResponse
         """
         response = await self.client.request(method="GET", endpoint="/")
-        return PingResponse.model_validate(response.content)
+        return PingResponse.model_validate_json(response.body)
@@ -1,12 +1,24 @@
+import sys
 from collections.abc import Iterable
-from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, Tuple, Type, Union, cast
 from urllib.parse import urlencode, urljoin
 
 import orjson
-from typing_extensions import TypeGuard, TypeVar
+from pydantic import BaseModel, RootModel, TypeAdapter, ValidationError
+from typing_extensions import Annotated, TypeGuard, TypeVar, get_args, get_origin
 
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    _UNION_TYPES: Tuple[Any, ...] = (Union, UnionType)
+else:
+    _UNION_TYPES = (Union,)
+
 
 def serialize(data: Any) -> bytes:
     return orjson.dumps(data)
@@ -16,7 +28,7 @@ def deserialize(data: bytes) -> Any:
     return orjson.loads(data)
 
 
-def build_accept_header(accepted_types: List[Tuple[str, float]]) -> str:
+def build_accept_header(accepted_types: Sequence[Tuple[str, float]]) -> str:
     accept_strings = []
     for content_type, quality in accepted_types:
         quality = f"; q={quality}" if quality < 1.0 else ""  # type: ignore
@@ -24,26 +36,44 @@ def build_accept_header(accepted_types: List[Tuple[str, float]]) -> str:
     return ", ".join(accept_strings)
 
 
+@lru_cache(maxsize=16)
+def _url_origin(base_url: str) -> str:
+    return urljoin(base_url, "/").rstrip("/")
+
+
+def _urljoin(base_url: str, path: str) -> str:
+    # Endpoints are absolute paths, often with ids formatted in, so only the
+    # base URL is parsed (once per client) and the path is appended to it
+    if path.startswith("/") and not path.startswith("//") and "/." not in path:
+        return _url_origin(base_url) + path
+    return urljoin(base_url, path)
+
+
 def build_url(
     base_url: str,
     endpoint: str,
     query: Optional[dict] = None,
     params: Optional[dict] = None,
 ) -> str:
-    params = {k: str(v) for k, v in (params or {}).items()}
-    path = endpoint.format(**params)
-    url = urljoin(base_url, path)
+    # Endpoints without params are used as-is, skipping the template parse
+    path = endpoint.format(**{k: str(v) for k, v in params.items()}) if params else endpoint
+    url = _urljoin(base_url, path)
 
     if query:
         query_parts = []
         for k, v in query.items():
             if v is None:
                 continue
-            if isinstance(v, Iterable) and not isinstance(v, str):
+            # Concrete types are much cheaper to check than the Iterable ABC
+            if isinstance(v, (list, tuple, set, frozenset)) or (
+                isinstance(v, Iterable) and not isinstance(v, (str, bytes))
+            ):
                 query_parts.extend([(k, str(item)) for item in v])
             else:
                 query_parts.append((k, str(v)))
-        url += "?" + urlencode(query_parts, doseq=True)
+
+        if query_parts:
+            url += "?" + urlencode(query_parts)
 
     return url
 
@@ -67,6 +97,118 @@ def parse_content_type(content_type: str):
     return mime_type, params
 
 
+# Types that JSON decodes to directly, so trusted values never need coercion
+_JSON_TYPES = frozenset({Any, object, str, int, float, bool, type(None)})
+
+
+@lru_cache(maxsize=None)
+def _scalar_adapter(annotation: Any) -> TypeAdapter:
+    return TypeAdapter(annotation)
+
+
+def _is_coerced_scalar(annotation: Any, value: Any) -> bool:
+    """
+    Whether `value` is a JSON scalar standing in for a richer type, such as a
+    string holding a UUID, datetime or URL.
+    """
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        return False
+
+    if annotation in _JSON_TYPES:
+        return annotation is float and isinstance(value, int)
+
+    return get_origin(annotation) is None and isinstance(annotation, type)
+
+
+def _coerce_scalar(annotation: Any, value: Any) -> Any:
+    try:
+        return _scalar_adapter(annotation).validate_python(value)
+    except (ValidationError, TypeError):
+        return value
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        inner = get_args(annotation)[0]
+
+        # Coerce with the full annotation so its validators still apply
+        if _is_coerced_scalar(inner, value):
+            return _coerce_scalar(annotation, value)
+
+        return _construct_value(inner, value)
+
+    if origin in _UNION_TYPES:
+        members = get_args(annotation)
+
+        if type(value) in members:
+            return value
+
+        # The data is trusted to match one of the members, so take the first
+        # member that the value can be constructed as
+        for member in members:
+            constructed = _construct_value(member, value)
+
+            if constructed is not value:
+                return constructed
+
+        return value
+
+    if isinstance(value, dict):
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return construct_model(annotation, value)
+
+        if origin is dict:
+            _, value_annotation = get_args(annotation) or (Any, Any)
+            return {key: _construct_value(value_annotation, item) for key, item in value.items()}
+
+    elif isinstance(value, list) and origin is list:
+        (item_annotation,) = get_args(annotation) or (Any,)
+        return [_construct_value(item_annotation, item) for item in value]
+
+    elif _is_coerced_scalar(annotation, value):
+        return _coerce_scalar(annotation, value)
+
+    return value
+
+
+def construct_model(model: Type[M], data: Any) -> M:
+    """
+    Build a model from trusted data without validating it.
+
+    Nested models are constructed recursively through lists, dicts, optional
+    and union fields, and root models wrap their constructed root value.
+    Scalars that JSON cannot represent directly, such as UUIDs, datetimes and
+    URLs, are converted to their declared types, and integers are converted
+    for float fields. Any other value is stored as-is, without validation.
+
+    This is a trust boundary: only use it for data that is known to match the
+    model, such as responses from the AskNews API. Anything else must go
+    through `model_validate`.
+
+    :param model: The model class
+    :type model: Type[M]
+    :param data: The model data
+    :type data: Any
+    :return: The model instance
+    :rtype: M
+    """
+    if issubclass(model, RootModel):
+        root = _construct_value(model.model_fields["root"].annotation, data)
+        return cast(M, model.model_construct(root))
+
+    fields = {}
+
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+
+        if key in data:
+            fields[key] = _construct_value(field.annotation, data[key])
+
+    return model.model_construct(**fields)
+
+
 def is_async_iterator(obj: AsyncIterator[T]) -> TypeGuard[AsyncIterator[T]]:
     return hasattr(obj, "__aiter__")
 
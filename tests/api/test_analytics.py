@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from urllib.parse import parse_qs
 
@@ -6,6 +7,7 @@ from polyfactory.factories.pydantic_factory import ModelFactory
 from respx import MockRouter
 
 from asknews_sdk.api.analytics import AnalyticsAPI, AsyncAnalyticsAPI
+from asknews_sdk.cache import TTLCache
 from asknews_sdk.client import APIClient, AsyncAPIClient
 from asknews_sdk.dto.sentiment import FinanceResponse
 
@@ -94,3 +96,116 @@ async def test_async_analytics_api_get_asset_sentiment(
         "date_from": [date_from.isoformat()],
         "date_to": [date_to.isoformat()],
     }
+
+
+def test_sync_analytics_api_get_asset_sentiment_cached(
+    sync_api_client: APIClient, response_mock: MockRouter
+):
+    analytics_api = AnalyticsAPI(sync_api_client, cache=TTLCache(), serve_stale=True)
+    mock_response = MockFinanceResponse.build()
+
+    mock_route = response_mock.get("/v1/analytics/finance/sentiment").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    first = analytics_api.get_asset_sentiment("bitcoin")
+    second = analytics_api.get_asset_sentiment("bitcoin")
+
+    assert first is second
+    assert mock_route.call_count == 1
+
+    analytics_api.get_asset_sentiment("ethereum")
+
+    assert mock_route.call_count == 2
+
+    analytics_api.cache.set(("sentiment", "bitcoin", "news_positive", None, None), first, ttl=0)
+    mock_route.respond(status_code=503, json={"code": 503000, "detail": "Unavailable"})
+
+    assert analytics_api.get_asset_sentiment("bitcoin") is first
+    assert mock_route.call_count == 3
+
+
+def test_sync_analytics_api_get_asset_sentiment_headers_bypass_cache(
+    sync_api_client: APIClient, response_mock: MockRouter
+):
+    analytics_api = AnalyticsAPI(sync_api_client, cache=TTLCache())
+    mock_response = MockFinanceResponse.build()
+
+    mock_route = response_mock.get("/v1/analytics/finance/sentiment").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    analytics_api.get_asset_sentiment("bitcoin")
+    analytics_api.get_asset_sentiment("bitcoin", http_headers={"x-tenant": "a"})
+    analytics_api.get_asset_sentiment("bitcoin", http_headers={"x-tenant": "b"})
+
+    assert mock_route.call_count == 3
+    assert len(analytics_api.cache) == 1
+
+
+async def test_async_analytics_api_get_asset_sentiment_cached(
+    async_api_client: AsyncAPIClient, response_mock: MockRouter
+):
+    analytics_api = AsyncAnalyticsAPI(async_api_client, cache=TTLCache())
+    mock_response = MockFinanceResponse.build()
+
+    mock_route = response_mock.get("/v1/analytics/finance/sentiment").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    responses = await asyncio.gather(
+        *(analytics_api.get_asset_sentiment("bitcoin") for _ in range(3))
+    )
+
+    assert all(response is responses[0] for response in responses)
+    assert mock_route.call_count == 1
+    assert not analytics_api._cache_locks
+
+
+async def test_async_analytics_api_get_assets_sentiment(
+    async_analytics_api: AsyncAnalyticsAPI, response_mock: MockRouter
+):
+    mock_response = MockFinanceResponse.build()
+
+    mock_route = response_mock.get("/v1/analytics/finance/sentiment").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    response = await async_analytics_api.get_assets_sentiment(
+        ["bitcoin", "ethereum", "bitcoin"], metric="news_total", max_concurrency=1
+    )
+
+    assert list(response) == ["bitcoin", "ethereum"]
+    assert all(isinstance(item, FinanceResponse) for item in response.values())
+    assert mock_route.call_count == 2
+    assert sorted(
+        parse_qs(call.request.url.query.decode())["asset"][0] for call in mock_route.calls
+    ) == ["bitcoin", "ethereum"]
+
+
+async def test_async_analytics_api_get_assets_sentiment_invalid_args(
+    async_analytics_api: AsyncAnalyticsAPI, response_mock: MockRouter
+):
+    mock_route = response_mock.get("/v1/analytics/finance/sentiment")
+
+    with pytest.raises(ValueError):
+        await async_analytics_api.get_assets_sentiment(["bitcoin", "not-an-asset"])
+
+    with pytest.raises(ValueError):
+        await async_analytics_api.get_assets_sentiment(["bitcoin"], max_concurrency=0)
+
+    assert not mock_route.called
+
+
+def test_sync_analytics_api_get_asset_sentiment_invalid_args(
+    sync_analytics_api: AnalyticsAPI, response_mock: MockRouter
+):
+    mock_route = response_mock.get("/v1/analytics/finance/sentiment")
+
+    with pytest.raises(ValueError):
+        sync_analytics_api.get_asset_sentiment("not-an-asset")
+
+    with pytest.raises(ValueError):
+        sync_analytics_api.get_asset_sentiment("bitcoin", metric="not-a-metric")
+
+    assert not mock_route.called
@@ -0,0 +1,121 @@
+import asyncio
+import re
+from functools import partial
+from pathlib import Path
+
+import pytest
+from httpx import HTTPError
+
+import asknews_sdk
+import asknews_sdk.api
+from asknews_sdk.api.base import BaseAPI
+from asknews_sdk.cache import TTLCache
+
+
+def test_api_groups_share_base_api():
+    for name in asknews_sdk.api.__all__:
+        api = getattr(asknews_sdk.api, name)
+
+        assert issubclass(api, BaseAPI)
+        assert api.__mro__[1] is BaseAPI
+
+
+def test_base_api_defined_once():
+    package = Path(asknews_sdk.__file__).parent
+    definitions = [
+        path.relative_to(package).as_posix()
+        for path in package.rglob("*.py")
+        if re.search(r"^class BaseAPI\b", path.read_text(), re.MULTILINE)
+    ]
+
+    assert definitions == ["api/base.py"]
+
+
+def test_base_api_trust_server(sync_api_client, monkeypatch):
+    monkeypatch.delenv("ASKNEWS_TRUST_SERVER", raising=False)
+    assert BaseAPI(sync_api_client).validate_responses is True
+
+    monkeypatch.setenv("ASKNEWS_TRUST_SERVER", "1")
+
+    assert BaseAPI(sync_api_client).validate_responses is False
+    assert BaseAPI(sync_api_client, validate_responses=True).validate_responses is True
+
+
+async def test_base_api_single_flight_cancelled(async_api_client):
+    api = BaseAPI(async_api_client, coalesce_requests=True)
+    cancelled = False
+
+    async def loader():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(api._acached_request(("key",), loader), 0.05)
+
+    await asyncio.sleep(0)
+
+    assert cancelled
+    assert not api._inflight
+
+
+async def test_base_api_single_flight_error(async_api_client):
+    api = BaseAPI(async_api_client, coalesce_requests=True)
+
+    async def loader():
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(api._acached_request(("key",), loader) for _ in range(2)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not api._inflight
+
+
+async def test_base_api_cache_lock_released(async_api_client):
+    api = BaseAPI(async_api_client, cache=TTLCache(ttl=60))
+    active = peak = 0
+
+    async def loader():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        raise HTTPError("boom")
+
+    async def late_request():
+        await asyncio.sleep(0.015)
+        return await api._acached_request(("key",), loader)
+
+    results = await asyncio.gather(
+        api._acached_request(("key",), loader),
+        api._acached_request(("key",), loader),
+        late_request(),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, HTTPError) for result in results)
+    assert peak == 1
+    assert not api._cache_locks
+
+
+async def test_base_api_gather_bounded():
+    active = peak = 0
+
+    async def loader(value):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return value
+
+    results = await BaseAPI._gather((partial(loader, value) for value in range(6)), 2)
+
+    assert results == list(range(6))
+    assert peak == 2
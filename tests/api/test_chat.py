@@ -1,18 +1,24 @@
 from inspect import isasyncgen, isgenerator
 
+import orjson
 import pytest
 from polyfactory.factories.pydantic_factory import ModelFactory
+from pydantic import ValidationError
 from respx import MockRouter
 
 from asknews_sdk.api.chat import AsyncChatAPI, ChatAPI
+from asknews_sdk.cache import TTLCache
 from asknews_sdk.client import APIClient, AsyncAPIClient
 from asknews_sdk.dto.chat import (
+    CreateChatCompletionRequest,
+    CreateChatCompletionRequestMessage,
     CreateChatCompletionResponse,
+    CreateChatCompletionResponseChoice,
     CreateChatCompletionResponseStream,
+    CreateChatCompletionResponseUsage,
     HeadlineQuestionsResponse,
     ListModelResponse,
 )
-from asknews_sdk.utils import build_accept_header
 
 
 class MockCreateChatCompletionResponse(ModelFactory[CreateChatCompletionResponse]):
@@ -62,13 +68,18 @@ def test_sync_chat_api_get_chat_completions(sync_chat_api: ChatAPI, response_moc
     assert mocked_route.called
     assert mocked_route.calls.last.request.url.path == "/v1/openai/chat/completions"
     assert mocked_route.calls.last.request.method == "POST"
-    assert mocked_route.calls.last.request.headers["accept"] == build_accept_header(
-        [
-            (CreateChatCompletionResponse.__content_type__, 1.0),
-            (CreateChatCompletionResponseStream.__content_type__, 1.0),
-        ]
+    assert mocked_route.calls.last.request.headers["accept"] == (
+        CreateChatCompletionResponse.__content_type__
     )
     assert mocked_route.calls.last.request.headers["custom-header"] == "custom-value"
+    assert mocked_route.calls.last.request.headers.get_list("content-type") == [
+        CreateChatCompletionRequest.__content_type__
+    ]
+    assert orjson.loads(mocked_route.calls.last.request.content) == {
+        **CreateChatCompletionRequest(messages=[]).model_dump(mode="json", exclude_none=True),
+        "messages": [{"role": "user", "content": "Hello"}],
+        "model": "gpt-4o-mini",
+    }
     assert mocked_route.calls.last.response.status_code == 200
 
 
@@ -105,11 +116,8 @@ def test_sync_chat_api_get_chat_completions_stream(
     assert mocked_route.called
     assert mocked_route.calls.last.request.url.path == "/v1/openai/chat/completions"
     assert mocked_route.calls.last.request.method == "POST"
-    assert mocked_route.calls.last.request.headers["accept"] == build_accept_header(
-        [
-            (CreateChatCompletionResponse.__content_type__, 1.0),
-            (CreateChatCompletionResponseStream.__content_type__, 1.0),
-        ]
+    assert mocked_route.calls.last.request.headers["accept"] == (
+        CreateChatCompletionResponseStream.__content_type__
     )
     assert mocked_route.calls.last.request.headers["custom-header"] == "custom-value"
     assert mocked_route.calls.last.response.status_code == 200
@@ -138,11 +146,8 @@ async def test_async_chat_api_get_chat_completions(
     assert mocked_route.called
     assert mocked_route.calls.last.request.url.path == "/v1/openai/chat/completions"
     assert mocked_route.calls.last.request.method == "POST"
-    assert mocked_route.calls.last.request.headers["accept"] == build_accept_header(
-        [
-            (CreateChatCompletionResponse.__content_type__, 1.0),
-            (CreateChatCompletionResponseStream.__content_type__, 1.0),
-        ]
+    assert mocked_route.calls.last.request.headers["accept"] == (
+        CreateChatCompletionResponse.__content_type__
     )
     assert mocked_route.calls.last.request.headers["custom-header"] == "custom-value"
     assert mocked_route.calls.last.response.status_code == 200
@@ -181,11 +186,8 @@ async def test_async_chat_api_get_chat_completions_stream(
     assert mocked_route.called
     assert mocked_route.calls.last.request.url.path == "/v1/openai/chat/completions"
     assert mocked_route.calls.last.request.method == "POST"
-    assert mocked_route.calls.last.request.headers["accept"] == build_accept_header(
-        [
-            (CreateChatCompletionResponse.__content_type__, 1.0),
-            (CreateChatCompletionResponseStream.__content_type__, 1.0),
-        ]
+    assert mocked_route.calls.last.request.headers["accept"] == (
+        CreateChatCompletionResponseStream.__content_type__
     )
     assert mocked_route.calls.last.request.headers["custom-header"] == "custom-value"
     assert mocked_route.calls.last.response.status_code == 200
@@ -268,6 +270,22 @@ def test_sync_chat_api_get_headline_questions(sync_chat_api: ChatAPI, response_m
     assert mocked_route.calls.last.response.status_code == 200
 
 
+def test_sync_chat_api_get_headline_questions_queries(
+    sync_chat_api: ChatAPI, response_mock: MockRouter
+):
+    mock_response = MockHeadlineQuestionsResponse.build()
+
+    mocked_route = response_mock.get("/v1/chat/questions").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    sync_chat_api.get_headline_questions(queries=["bitcoin", "ai"])
+    assert mocked_route.calls.last.request.url.params.get_list("queries") == ["bitcoin", "ai"]
+
+    sync_chat_api.get_headline_questions()
+    assert mocked_route.calls.last.request.url.query == b""
+
+
 async def test_async_chat_api_get_headline_questions(
     async_chat_api: AsyncChatAPI, response_mock: MockRouter
 ):
@@ -293,3 +311,139 @@ async def test_async_chat_api_get_headline_questions(
     assert mocked_route.calls.last.request.headers["accept"] == HeadlineQuestionsResponse.__content_type__
     assert mocked_route.calls.last.request.headers["custom-header"] == "custom-value"
     assert mocked_route.calls.last.response.status_code == 200
+
+
+async def test_async_chat_api_get_headline_questions_many(
+    async_chat_api: AsyncChatAPI, response_mock: MockRouter
+):
+    mock_response = MockHeadlineQuestionsResponse.build()
+
+    mocked_route = response_mock.get("/v1/chat/questions").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    responses = await async_chat_api.get_headline_questions_many(
+        [["bitcoin"], ["ai", "nvidia"], None], max_concurrency=1
+    )
+
+    assert len(responses) == 3
+    assert all(isinstance(response, HeadlineQuestionsResponse) for response in responses)
+    assert mocked_route.call_count == 3
+    assert sorted(
+        call.request.url.params.get_list("queries") for call in mocked_route.calls
+    ) == [[], ["ai", "nvidia"], ["bitcoin"]]
+
+
+async def test_async_chat_api_get_headline_questions_many_invalid_args(
+    async_chat_api: AsyncChatAPI, response_mock: MockRouter
+):
+    mocked_route = response_mock.get("/v1/chat/questions")
+
+    with pytest.raises(ValueError):
+        await async_chat_api.get_headline_questions_many([["bitcoin"], "ai"])
+
+    with pytest.raises(ValueError):
+        await async_chat_api.get_headline_questions_many([["bitcoin"], [1]])
+
+    with pytest.raises(ValueError):
+        await async_chat_api.get_headline_questions_many([["bitcoin"]], max_concurrency=0)
+
+    assert not mocked_route.called
+
+
+def test_sync_chat_api_get_chat_completions_without_validation(
+    sync_api_client: APIClient, response_mock: MockRouter
+):
+    mock_response = MockCreateChatCompletionResponse.build()
+    chat_api = ChatAPI(sync_api_client, validate_responses=False)
+
+    response_mock.post("/v1/openai/chat/completions").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    response = chat_api.get_chat_completions(messages=[{"role": "user", "content": "Hello"}])
+
+    assert isinstance(response, CreateChatCompletionResponse)
+    assert isinstance(response.usage, CreateChatCompletionResponseUsage)
+
+    for choice in response.choices:
+        assert isinstance(choice, CreateChatCompletionResponseChoice)
+        assert isinstance(choice.message, CreateChatCompletionRequestMessage)
+
+    assert response.model_dump(mode="json") == mock_response.model_dump(mode="json")
+
+
+async def test_chat_api_invalid_args(sync_chat_api: ChatAPI, async_chat_api: AsyncChatAPI):
+    with pytest.raises(ValueError):
+        sync_chat_api.get_chat_completions(messages=[{"content": "Hello"}])
+
+    with pytest.raises(ValueError):
+        await async_chat_api.get_chat_completions(messages=[{"role": "user"}])
+
+    with pytest.raises(ValueError):
+        sync_chat_api.get_chat_completions(messages=["role: user, content: Hello"])
+
+    with pytest.raises(ValueError):
+        sync_chat_api.get_chat_completions(messages=[("role", "content")])
+
+    with pytest.raises(ValueError):
+        sync_chat_api.get_chat_completions(
+            messages=[{"role": "user", "content": "Hello"}], model="unknown"
+        )
+
+    with pytest.raises(ValueError):
+        sync_chat_api.get_forecast(query="Hello", method="unknown")
+
+    with pytest.raises(ValueError):
+        await async_chat_api.get_forecast(query="Hello", expert="unknown")
+
+
+def test_sync_chat_api_get_chat_completions_stream_without_validation(
+    sync_api_client: APIClient, response_mock: MockRouter
+):
+    mock_chunk = MockCreateChatCompletionResponseStream.build()
+    chat_api = ChatAPI(sync_api_client, validate_responses=False)
+
+    response_mock.post("/v1/openai/chat/completions").respond(
+        content=b"data: " + mock_chunk.model_dump_json().encode() + b"\n\ndata: [DONE]\n\n",
+        headers={"content-type": CreateChatCompletionResponseStream.__content_type__},
+    )
+
+    chunks = list(
+        chat_api.get_chat_completions(
+            messages=[{"role": "user", "content": "Hello"}], stream=True
+        )
+    )
+
+    assert len(chunks) == 1
+    assert isinstance(chunks[0], CreateChatCompletionResponseStream)
+    assert chunks[0].model_dump(mode="json") == mock_chunk.model_dump(mode="json")
+
+
+def test_sync_chat_api_get_chat_completions_validate_requests(
+    sync_chat_api: ChatAPI, response_mock: MockRouter, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr("asknews_sdk.api.chat._VALIDATE_REQUESTS", True)
+    mocked_route = response_mock.post("/v1/openai/chat/completions")
+
+    with pytest.raises(ValidationError):
+        sync_chat_api.get_chat_completions(messages=[{"role": "user", "content": 1}])
+
+    assert not mocked_route.called
+
+
+async def test_async_chat_api_list_chat_models_cached(
+    async_api_client: AsyncAPIClient, response_mock: MockRouter
+):
+    chat_api = AsyncChatAPI(async_api_client, cache=TTLCache())
+    mock_response = MockListModelResponse.build()
+
+    mocked_route = response_mock.get("/v1/openai/models").respond(
+        content=mock_response.model_dump_json()
+    )
+
+    first = await chat_api.list_chat_models()
+    second = await chat_api.list_chat_models()
+
+    assert first is second
+    assert mocked_route.call_count == 1
@@ -1,10 +1,16 @@
-from uuid import uuid4
+import asyncio
+import warnings
+from datetime import datetime
+from uuid import UUID, uuid4
 
 import pytest
+from httpx import Response
 from polyfactory.factories.pydantic_factory import ModelFactory
+from pydantic import AnyUrl
 from respx import MockRouter
 
 from asknews_sdk.api.news import AsyncNewsAPI, NewsAPI
+from asknews_sdk.cache import TTLCache
 from asknews_sdk.client import APIClient, AsyncAPIClient
 from asknews_sdk.dto.news import ArticleResponse, SearchResponse, SourceReportResponse
 from asknews_sdk.errors import ResourceNotFoundError
@@ -119,6 +125,120 @@ async def test_async_news_api_get_article(async_news_api: AsyncNewsAPI, response
     assert mock_route.calls.last.response.status_code == 404
 
 
+def test_sync_news_api_get_article_cached(sync_api_client: APIClient, response_mock: MockRouter):
+    article_id = uuid4()
+    mock_article = MockArticleResponse.build(article_id=article_id)
+    news_api = NewsAPI(sync_api_client, cache=TTLCache())
+
+    mock_route = response_mock.get(f"/v1/news/{article_id}").respond(
+        content=mock_article.model_dump_json()
+    )
+
+    first = news_api.get_article(article_id)
+    second = news_api.get_article(str(article_id))
+
+    assert first is second
+    assert mock_route.call_count == 1
+
+
+def test_sync_news_api_get_article_without_validation(
+    sync_api_client: APIClient, response_mock: MockRouter
+):
+    article_id = uuid4()
+    mock_article = MockArticleResponse.build(article_id=article_id)
+    news_api = NewsAPI(sync_api_client, validate_responses=False)
+
+    response_mock.get(f"/v1/news/{article_id}").respond(content=mock_article.model_dump_json())
+
+    response = news_api.get_article(article_id)
+    validated = ArticleResponse.model_validate_json(mock_article.model_dump_json())
+
+    assert isinstance(response.article_id, UUID)
+    assert isinstance(response.pub_date, datetime)
+    assert isinstance(response.article_url, AnyUrl)
+
+    for name in ArticleResponse.model_fields:
+        assert type(getattr(response, name)) is type(getattr(validated, name)), name
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert response.model_dump() == validated.model_dump()
+
+
+async def test_async_news_api_get_article_single_flight(
+    async_api_client: AsyncAPIClient, async_news_api: AsyncNewsAPI, response_mock: MockRouter
+):
+    article_id = uuid4()
+    mock_article = MockArticleResponse.build(article_id=article_id)
+    news_api = AsyncNewsAPI(async_api_client, coalesce_requests=True)
+
+    mock_route = response_mock.get(f"/v1/news/{article_id}").respond(
+        content=mock_article.model_dump_json()
+    )
+
+    responses = await asyncio.gather(*(news_api.get_article(article_id) for _ in range(3)))
+
+    assert all(response is responses[0] for response in responses)
+    assert mock_route.call_count == 1
+    assert not news_api._inflight
+
+    await news_api.get_article(article_id)
+    assert mock_route.call_count == 2
+
+    await asyncio.gather(
+        news_api.get_article(article_id, http_headers={"x-tenant": "a"}),
+        news_api.get_article(article_id, http_headers={"x-tenant": "b"}),
+    )
+    assert mock_route.call_count == 4
+
+    # Coalescing is opt-in
+    await asyncio.gather(*(async_news_api.get_article(article_id) for _ in range(2)))
+    assert mock_route.call_count == 6
+
+
+async def test_async_news_api_get_articles(
+    async_news_api: AsyncNewsAPI, response_mock: MockRouter
+):
+    mock_articles = [MockArticleResponse.build(article_id=uuid4()) for _ in range(3)]
+
+    for mock_article in mock_articles:
+        response_mock.get(f"/v1/news/{mock_article.article_id}").respond(
+            content=mock_article.model_dump_json()
+        )
+
+    response = await async_news_api.get_articles(
+        [mock_article.article_id for mock_article in mock_articles]
+    )
+
+    assert [article.article_id for article in response] == [
+        mock_article.article_id for mock_article in mock_articles
+    ]
+    assert all(isinstance(article, ArticleResponse) for article in response)
+
+
+async def test_async_news_api_get_articles_max_concurrency(
+    async_news_api: AsyncNewsAPI, response_mock: MockRouter
+):
+    mock_article = MockArticleResponse.build()
+    active = peak = 0
+
+    async def respond(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Response(200, content=mock_article.model_dump_json())
+
+    mock_route = response_mock.get(url__regex=r"/v1/news/[^/]+$").mock(side_effect=respond)
+
+    response = await async_news_api.get_articles([uuid4() for _ in range(5)], max_concurrency=2)
+
+    assert len(response) == 5
+    assert mock_route.call_count == 5
+    assert peak == 2
+
+
 def test_sync_news_api_search_news(sync_news_api: NewsAPI, response_mock: MockRouter):
     mock_search_response = MockSearchResponse.build()
 
@@ -140,11 +260,61 @@ def test_sync_news_api_search_news(sync_news_api: NewsAPI, response_mock: MockRo
     assert mock_route.called
     assert mock_route.calls.last.request.url.path == "/v1/news/search"
     assert mock_route.calls.last.request.method == "GET"
+    assert mock_route.calls.last.request.url.params.get_list("categories") == ["All"]
     assert mock_route.calls.last.request.headers["accept"] == SearchResponse.__content_type__
     assert mock_route.calls.last.request.headers["custom-header"] == "custom-value"
     assert mock_route.calls.last.response.status_code == 200
 
 
+def test_sync_news_api_search_news_without_validation(
+    sync_api_client: APIClient, response_mock: MockRouter
+):
+    mock_search_response = MockSearchResponse.build()
+    news_api = NewsAPI(sync_api_client, validate_responses=False)
+
+    response_mock.get("/v1/news/search").respond(
+        content=mock_search_response.model_dump_json()
+    )
+
+    response = news_api.search_news("query")
+
+    assert isinstance(response, SearchResponse)
+    assert response.model_dump(mode="json") == mock_search_response.model_dump(mode="json")
+
+
+async def test_news_api_invalid_args(
+    sync_news_api: NewsAPI, async_news_api: AsyncNewsAPI, response_mock: MockRouter
+):
+    search_route = response_mock.get("/v1/news/search")
+    reddit_route = response_mock.get("/v1/reddit/search")
+
+    with pytest.raises(ValueError):
+        sync_news_api.search_news("query", time_filter="not-a-filter")
+
+    with pytest.raises(ValueError):
+        sync_news_api.search_news("query", categories=["Business", "not-a-category"])
+
+    with pytest.raises(ValueError):
+        await async_news_api.search_news("query", strategy="not-a-strategy")
+
+    with pytest.raises(ValueError):
+        sync_news_api.search_reddit(["query"], sort="not-a-sort")
+
+    with pytest.raises(ValueError):
+        await async_news_api.search_reddit(["query"], method="both")
+
+    assert not search_route.called
+    assert not reddit_route.called
+
+    search_route.respond(content=MockSearchResponse.build().model_dump_json())
+    sync_news_api.search_news("query", categories="Business")
+
+    assert search_route.calls.last.request.url.params.get_list("categories") == ["Business"]
+
+    with pytest.raises(ValueError):
+        sync_news_api.search_news("query", categories="Bogus")
+
+
 async def test_async_news_api_search_news(async_news_api: AsyncNewsAPI, response_mock: MockRouter):
     mock_search_response = MockSearchResponse.build()
 
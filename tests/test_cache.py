@@ -0,0 +1,68 @@
+from threading import Thread
+
+from asknews_sdk.cache import MISSING, TTLCache
+
+
+def test_ttl_cache_get_set():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    assert cache.get("a") is MISSING
+    assert cache.get("a", None) is None
+
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+    assert cache.pop("a") == 1
+    assert "a" not in cache
+
+
+def test_ttl_cache_expiry():
+    cache = TTLCache(ttl=60)
+
+    cache.set("a", 1, ttl=0)
+
+    assert cache.get("a") is MISSING
+    assert "a" not in cache
+    assert cache.get_stale("a") == 1
+
+
+def test_ttl_cache_eviction():
+    cache = TTLCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is MISSING
+    assert cache.get("c") == 3
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_ttl_cache_threads():
+    cache = TTLCache(maxsize=8, ttl=60)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                cache.set((offset + i) % 16, i)
+                cache.get((offset + i + 1) % 16)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(cache) == 8
@@ -43,6 +43,13 @@ def test_build_api_request(sync_api_client: APIClient):
     assert request.headers.get("content-type") == "application/octet-stream"
     assert request.content == b"test"
 
+    headers = {"Content-Type": "application/json"}
+    request = sync_api_client.build_api_request("POST", "/test", body=b"{}", headers=headers)
+
+    assert request.headers.get_list("content-type") == ["application/json"]
+    assert request.content == b"{}"
+    assert headers == {"Content-Type": "application/json"}
+
     request = sync_api_client.build_api_request(
         "GET",
         "/test",
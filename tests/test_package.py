@@ -0,0 +1,22 @@
+import subprocess
+import sys
+
+import pytest
+
+import asknews_sdk
+
+
+def test_sdk_imported_lazily():
+    code = "import sys, asknews_sdk; assert 'asknews_sdk.sdk' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_attributes():
+    from asknews_sdk.sdk import AskNewsSDK, AsyncAskNewsSDK
+
+    assert asknews_sdk.AskNewsSDK is AskNewsSDK
+    assert asknews_sdk.AsyncAskNewsSDK is AsyncAskNewsSDK
+    assert set(asknews_sdk.__all__) <= set(dir(asknews_sdk))
+
+    with pytest.raises(AttributeError):
+        asknews_sdk.Missing
@@ -1,7 +1,13 @@
 import pytest
 from httpx import AsyncByteStream, Request, Response, SyncByteStream
 
-from asknews_sdk.response import APIResponse, EventSource
+from asknews_sdk.response import (
+    APIResponse,
+    EventSource,
+    SSEDecoder,
+    aiter_sse_data,
+    iter_sse_data,
+)
 
 
 def test_api_response():
@@ -13,8 +19,11 @@ def test_api_response():
     )
     api_response = APIResponse.from_httpx_response(response)
 
+    assert "content" not in vars(api_response)
+    assert api_response.body == b'{"key": "value"}'
     assert api_response.status_code == 200
     assert api_response.content == {"key": "value"}
+    assert "content" in vars(api_response)
     assert api_response.content_type == "application/json"
     assert api_response.stream is False
 
@@ -199,3 +208,40 @@ async def test_event_source_async():
     assert events[1].event == "custom"
     assert events[1].id == ""
     assert events[1].retry == 0
+
+
+def test_iter_sse_data():
+    def sse_chunks():
+        yield b": This is a comment\n"
+        yield b"data: Hello, World!\n\ndata: Hel"
+        yield b"lo\r\ndata: World!\r\n\r"
+        yield b"\nevent: custom\nid: 123\n\n"
+        yield b"data: [DONE]\n"
+
+    assert list(iter_sse_data(sse_chunks())) == [
+        b"Hello, World!",
+        b"Hello\nWorld!",
+        b"[DONE]",
+    ]
+
+
+async def test_aiter_sse_data():
+    async def sse_chunks():
+        yield b"data: Hello, World!\n\ndata: Hel"
+        yield b"lo\ndata: World!\n\n"
+        yield b"data: [DONE]\n"
+
+    assert [data async for data in aiter_sse_data(sse_chunks())] == [
+        b"Hello, World!",
+        b"Hello\nWorld!",
+        b"[DONE]",
+    ]
+
+
+def test_sse_decoder():
+    decoder = SSEDecoder()
+
+    assert decoder.feed(b"data: Hel") == []
+    assert decoder.feed(b"lo\n\ndata: a\n\ndata: b") == [b"Hello", b"a"]
+    assert decoder.flush() == [b"b"]
+    assert decoder.flush() == []
@@ -0,0 +1,40 @@
+import asyncio
+import sys
+from types import ModuleType
+
+from asknews_sdk import install_fast_event_loop
+
+
+def _fake_loop_module(monkeypatch, installed):
+    name = "winloop" if sys.platform == "win32" else "uvloop"
+    module = ModuleType(name)
+    module.install = lambda: installed.append("install")
+    module.EventLoopPolicy = asyncio.DefaultEventLoopPolicy
+    monkeypatch.setitem(sys.modules, name, module)
+
+
+def test_install_fast_event_loop(monkeypatch):
+    installed = []
+    _fake_loop_module(monkeypatch, installed)
+    monkeypatch.setattr(sys, "version_info", (3, 11, 0))
+
+    assert install_fast_event_loop() is True
+    assert installed == ["install"]
+
+
+def test_install_fast_event_loop_without_deprecated_install(monkeypatch):
+    installed = []
+    _fake_loop_module(monkeypatch, installed)
+    monkeypatch.setattr(sys, "version_info", (3, 12, 0))
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", installed.append)
+
+    assert install_fast_event_loop() is True
+    assert len(installed) == 1
+    assert isinstance(installed[0], asyncio.DefaultEventLoopPolicy)
+
+
+def test_install_fast_event_loop_missing(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    monkeypatch.setitem(sys.modules, "winloop", None)
+
+    assert install_fast_event_loop() is False
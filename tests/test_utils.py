@@ -0,0 +1,89 @@
+import warnings
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel, Field, RootModel
+from typing_extensions import Annotated
+
+from asknews_sdk.utils import build_url, construct_model
+
+
+class Item(BaseModel):
+    name: str
+
+
+class Container(BaseModel):
+    item: Item
+    items: List[Item]
+    optional_item: Optional[Item] = None
+    mapping: Dict[str, Item]
+    count: int
+    ratio: float
+    uid: Optional[UUID] = None
+    created: Annotated[datetime, Field(title="Created")]
+    label: Union[str, UUID]
+
+
+class Root(RootModel[Dict[str, List[Item]]]): ...
+
+
+def test_build_url():
+    assert build_url("https://example.com", "/test") == "https://example.com/test"
+    assert (
+        build_url("https://example.com", "/test/{id}", params={"id": 1})
+        == "https://example.com/test/1"
+    )
+    assert build_url("https://example.com", "/test", query={"a": None}) == (
+        "https://example.com/test"
+    )
+    assert build_url(
+        "https://example.com",
+        "/test",
+        query={"a": ["x", "y"], "b": ("z",), "c": 1, "d": None, "e": "abc"},
+    ) == "https://example.com/test?a=x&a=y&b=z&c=1&e=abc"
+    assert build_url(
+        "https://example.com",
+        "/test",
+        query={"q": (x for x in "ab"), "k": {"x": 1}.keys(), "r": range(2), "s": b"xy"},
+    ) == "https://example.com/test?q=a&q=b&k=x&r=0&r=1&s=b%27xy%27"
+    assert build_url("https://example.com/api/", "/test/a/../b") == "https://example.com/test/b"
+    assert build_url("https://example.com/api/", "test") == "https://example.com/api/test"
+    assert build_url("https://example.com:8080/api", "/test") == "https://example.com:8080/test"
+
+
+def test_construct_model():
+    data = {
+        "item": {"name": "a"},
+        "items": [{"name": "b"}],
+        "optional_item": {"name": "c"},
+        "mapping": {"d": {"name": "d"}},
+        "count": 1,
+        "ratio": 2,
+        "uid": "2b6f5c0e-8b1a-4f0e-9a53-0f1d6b0f8a11",
+        "created": "2024-01-02T03:04:05Z",
+        "label": "2b6f5c0e-8b1a-4f0e-9a53-0f1d6b0f8a11",
+    }
+    container = construct_model(Container, data)
+
+    assert isinstance(container.item, Item)
+    assert isinstance(container.items[0], Item)
+    assert isinstance(container.optional_item, Item)
+    assert isinstance(container.mapping["d"], Item)
+    assert container.count == 1
+    assert container.ratio == 2.0 and isinstance(container.ratio, float)
+    assert container.uid == UUID(data["uid"])
+    assert container.created == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert container.label == data["label"]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert container.model_dump(mode="json") == Container.model_validate(data).model_dump(
+            mode="json"
+        )
+
+    assert construct_model(Container, {**data, "optional_item": None}).optional_item is None
+
+    root = construct_model(Root, {"a": [{"name": "a"}]})
+
+    assert isinstance(root.root["a"][0], Item)